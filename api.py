@@ -10,70 +10,338 @@ Usage:
 
 API Endpoints:
     POST /api/fetch - Start a historical data fetch
+    POST /api/fetch/batch - Start several historical data fetches
     GET /api/symbols - Get available trading symbols
     GET /api/intervals - Get supported timeframes
     GET /api/health - Health check
+    GET /api/fetch/<id>/events - Stream fetch status changes (server-sent events)
+    WS  /ws/fetch - Subscribe to status changes of several fetches
 """
 
+import hashlib
+import itertools
 import logging
-import sys
-import threading
 import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from threading import BoundedSemaphore, Condition, Lock, RLock
 
-from flask import Flask, request, Response
+import orjson
+from flask import Flask, request, Response, make_response, stream_with_context
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+from flask_sock import Sock
+from werkzeug.exceptions import HTTPException
 
 # Import existing modules
-from config import LOG_LEVEL, LOG_FORMAT
-from binance_client import fetch_and_insert_all_historical_data, get_futures_symbols
+from config import FETCH_MAX_WORKERS, FINISHED_FETCH_TTL, MAX_EVENT_STREAMS, MAX_FINISHED_FETCHES, SYMBOLS_CACHE_TTL
+from binance_client import fetch_and_insert_all_historical_data, get_futures_symbols, is_symbols_cache_stale
+from database import PoolBusyError, ping_database
+from logging_setup import setup_logging
 from app import validate_symbols, validate_intervals, initialize_rate_limiter
 from api_models import (
-    FetchRequest, FetchResponse, SymbolsResponse, IntervalsResponse,
-    create_error_response, create_success_response
+    ApiResponse, FetchResponse, SymbolsResponse, IntervalsResponse, SUPPORTED_INTERVALS,
+    create_error_response, create_success_response, current_timestamp, parse_fetch_request
 )
 
-# Configure logging
-logging.basicConfig(
-    level=LOG_LEVEL,
-    format=LOG_FORMAT,
-    handlers=[
-        logging.StreamHandler(sys.stdout)
-    ]
-)
 logger = logging.getLogger(__name__)
 
+# Largest request body accepted by the API (1 MB)
+MAX_REQUEST_BYTES = 1 * 1024 * 1024
+
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson for faster (de)serialization."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 # Initialize Flask app
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+app.config['MAX_CONTENT_LENGTH'] = MAX_REQUEST_BYTES  # Oversized bodies are rejected before parsing
 CORS(app)  # Enable CORS for all routes
+sock = Sock(app)
+
+# Bounded worker pool for background fetches; requests beyond the cap wait in the queue
+executor = ThreadPoolExecutor(max_workers=FETCH_MAX_WORKERS, thread_name_prefix='fetch')
+
+# The intervals payload is static, so build it once; only the timestamp is refreshed per request
+_INTERVALS_PAYLOAD = IntervalsResponse(
+    success=True,
+    message=f"Retrieved {len(SUPPORTED_INTERVALS)} supported intervals",
+    intervals=list(SUPPORTED_INTERVALS)
+).to_dict()
+
+# TradingView symbol string, rebuilt only when get_futures_symbols() returns a new list
+_perp_tv_cache = (None, '')
+
+# Seconds to reuse the last database health check result
+HEALTH_CACHE_TTL = 2
+
+# Seconds the health check waits for a pooled connection before reporting the database as busy
+HEALTH_POOL_TIMEOUT = 1
+_db_status_cache = (None, 0.0)
+_db_status_lock = Lock()
+
+# Warning header (RFC 7234) sent when Binance could not be reached and the last known symbols are served
+STALE_WARNING = '110 - "Response is Stale"'
+
+# Maximum number of fetch requests accepted by /api/fetch/batch
+MAX_BATCH_SIZE = 100
+
+class FetchRegistry:
+    """Thread-safe registry of fetch operations keyed by fetch ID."""
+
+    def __init__(self):
+        self._fetches = {}
+        self._finished = OrderedDict()  # fetch_id -> monotonic finish time, oldest first
+        self._lock = RLock()
+        self._changed = Condition(self._lock)
+        self._version = 0
+
+    def add(self, fetch_id, entry):
+        """Register a new fetch operation."""
+        with self._lock:
+            self._fetches[fetch_id] = entry
+
+    def update(self, fetch_id, **fields):
+        """Set fields on an existing fetch operation; does nothing if it was already evicted."""
+        with self._lock:
+            entry = self._fetches.get(fetch_id)
+            if entry is None:
+                return
+            entry.update(fields)
+            self._version += 1
+            self._changed.notify_all()
+
+    def finish(self, fetch_id, **fields):
+        """Set fields on a fetch operation and mark it finished, so it can be evicted later."""
+        with self._lock:
+            if fetch_id not in self._fetches:
+                return
+            self._finished[fetch_id] = time.monotonic()
+            self.update(fetch_id, **fields)
+
+    def evict_finished(self, max_age, max_count):
+        """
+        Remove finished fetch operations older than max_age seconds, and the oldest ones beyond max_count.
+
+        :return: List of evicted fetch IDs
+        """
+        evicted = []
+        with self._lock:
+            now = time.monotonic()
+            while self._finished:
+                fetch_id, finished_at = next(iter(self._finished.items()))
+                if now - finished_at < max_age and len(self._finished) <= max_count:
+                    break
+                del self._finished[fetch_id]
+                self._fetches.pop(fetch_id, None)
+                evicted.append(fetch_id)
+        return evicted
+
+    def get(self, fetch_id):
+        """Return a shallow copy of a fetch operation, or None if unknown."""
+        with self._lock:
+            entry = self._fetches.get(fetch_id)
+            return dict(entry) if entry is not None else None
+
+    @property
+    def version(self):
+        """Counter that increases on every update; pass it to wait_for_change."""
+        with self._lock:
+            return self._version
+
+    def wait_for_change(self, version, timeout=None):
+        """
+        Block until any fetch has been updated since `version` was read.
+
+        :return: True if a change happened, False on timeout
+        """
+        with self._changed:
+            return self._changed.wait_for(lambda: self._version != version, timeout)
+
+    def ids(self):
+        """Return a snapshot of all registered fetch IDs."""
+        with self._lock:
+            return list(self._fetches)
+
+    def __contains__(self, fetch_id):
+        with self._lock:
+            return fetch_id in self._fetches
+
+    def __len__(self):
+        with self._lock:
+            return len(self._fetches)
+
+
+# Seconds between keep-alive comments on idle event streams
+EVENT_STREAM_KEEPALIVE = 30
+
+# Seconds a WebSocket waits for fetch updates before checking for new client messages
+WEBSOCKET_POLL_INTERVAL = 1
+
+# Each SSE or WebSocket stream holds a server thread, so only MAX_EVENT_STREAMS are served at once
+_event_stream_slots = BoundedSemaphore(MAX_EVENT_STREAMS)
+
+# WebSocket close code telling clients to try again later (RFC 6455 registry)
+WS_CLOSE_TRY_AGAIN_LATER = 1013
 
 # Global variables for tracking active fetches
-active_fetches = {}
-fetch_counter = 0
+active_fetches = FetchRegistry()
+fetch_counter = itertools.count(1)
+
+# Queued or running fetches keyed by a hash of their parameters, so identical requests coalesce
+_in_flight = {}
+_in_flight_lock = Lock()
+
+
+def run_fetch(fetch_id, fetch_request, valid_intervals):
+    """
+    Run a historical data fetch. Executed on the background executor.
+
+    :param fetch_id: ID of the fetch operation
+    :param fetch_request: Validated FetchRequest
+    :param valid_intervals: List of validated intervals
+    """
+    logger.info("Starting fetch %s", fetch_id)
+    active_fetches.update(fetch_id, started_at=datetime.utcnow().isoformat())
+
+    # Initialize rate limiter
+    rate_limiter = initialize_rate_limiter()
+
+    # Start the historical data fetch
+    fetch_and_insert_all_historical_data(
+        rate_limiter=rate_limiter,
+        symbols=fetch_request.symbols,
+        intervals=valid_intervals,
+        start_date=fetch_request.start_date,
+        end_date=fetch_request.end_date,
+        data_type=fetch_request.data_type
+    )
+
+
+def _on_fetch_done(fetch_id, dedupe_key, future):
+    """Record completion time and log the outcome of a finished fetch."""
+    with _in_flight_lock:
+        if _in_flight.get(dedupe_key) == fetch_id:
+            del _in_flight[dedupe_key]
+
+    error = future.exception()
+    if error:
+        logger.error("Fetch %s failed: %s", fetch_id, error)
+        active_fetches.finish(fetch_id, failed_at=datetime.utcnow().isoformat())
+    else:
+        logger.info("Fetch %s completed successfully", fetch_id)
+        active_fetches.finish(fetch_id, completed_at=datetime.utcnow().isoformat())
+    evict_finished_fetches()
+
+
+def evict_finished_fetches():
+    """
+    Drop finished fetches older than FINISHED_FETCH_TTL or beyond MAX_FINISHED_FETCHES,
+    together with any dedupe keys still pointing at them.
+    """
+    evicted = set(active_fetches.evict_finished(FINISHED_FETCH_TTL, MAX_FINISHED_FETCHES))
+    if not evicted:
+        return
+    with _in_flight_lock:
+        for dedupe_key in [key for key, fetch_id in _in_flight.items() if fetch_id in evicted]:
+            del _in_flight[dedupe_key]
+    logger.debug("Evicted %d finished fetches", len(evicted))
+
+
+def get_fetch_info(fetch_id):
+    """
+    Build a serializable status view of a fetch, deriving its status from the future.
+
+    :param fetch_id: ID of the fetch operation
+    :return: Dictionary describing the fetch, or None if it is unknown or was evicted
+    """
+    entry = active_fetches.get(fetch_id)
+    if entry is None:
+        return None
+    future = entry.get('future')
+    info = {key: value for key, value in entry.items() if key != 'future'}
+
+    if future is None:
+        info['status'] = 'queued'
+    elif future.running():
+        info['status'] = 'running'
+    elif not future.done():
+        info['status'] = 'queued'
+    elif future.exception():
+        info['status'] = 'failed'
+        info['error'] = str(future.exception())
+    else:
+        info['status'] = 'completed'
+    return info
+
+
+def make_conditional_response(payload, etag_data, max_age, stale=False):
+    """
+    Build a cacheable JSON response with an ETag derived from the stable part of the payload.
+    Returns 304 Not Modified when the client already holds the current version.
+
+    :param payload: Response body as a dictionary
+    :param etag_data: JSON-serializable data the ETag is computed from (excludes timestamps)
+    :param max_age: Seconds clients may cache the response
+    :param stale: True if the payload is a fallback copy that could not be refreshed
+    :return: Flask response
+    """
+    etag = hashlib.md5(orjson.dumps(etag_data, option=orjson.OPT_SORT_KEYS)).hexdigest()
+    if etag in request.if_none_match:
+        response = Response(status=304)
+    else:
+        response = make_response(payload, 200)
+    response.set_etag(etag)
+    if stale:
+        response.headers['Cache-Control'] = 'no-cache'
+        response.headers['Warning'] = STALE_WARNING
+    else:
+        response.headers['Cache-Control'] = f'public, max-age={max_age}'
+    return response
+
+
+def get_database_status():
+    """
+    Return the database status, reusing the last result for HEALTH_CACHE_TTL seconds
+    so bursts of health probes share a single database round-trip.
+    """
+    global _db_status_cache
+
+    with _db_status_lock:
+        status, checked_at = _db_status_cache
+        if status is not None and time.monotonic() - checked_at < HEALTH_CACHE_TTL:
+            return status
+
+        try:
+            status = "connected" if ping_database(timeout=HEALTH_POOL_TIMEOUT) else "disconnected"
+        except PoolBusyError:
+            # Every connection is busy with inserts; the database is reachable but the probe must not wait
+            status = "busy"
+        except Exception as e:
+            logger.warning("Database health check failed: %s", e)
+            status = "error"
+        _db_status_cache = (status, time.monotonic())
+        return status
 
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint."""
-    try:
-        # Test database connection by trying to get exchange info
-        from database import connect_to_database
-        conn, cursor = connect_to_database()
-        if conn and cursor:
-            cursor.execute("SELECT 1;")
-            cursor.fetchone()
-            db_status = "connected"
-        else:
-            db_status = "disconnected"
-    except Exception as e:
-        logger.warning(f"Database health check failed: {e}")
-        db_status = "error"
-    
     health_data = {
         'status': 'healthy',
-        'database': db_status,
+        'database': get_database_status(),
         'active_fetches': len(active_fetches),
-        'timestamp': datetime.utcnow().isoformat()
+        'timestamp': current_timestamp()
     }
     
     return create_success_response("Service is healthy", health_data)
@@ -87,17 +355,36 @@ def get_symbols():
         if not symbols:
             return create_error_response("Failed to fetch symbols from Binance", 503)
         
+        stale = is_symbols_cache_stale()
         response = SymbolsResponse(
             success=True,
             message=f"Retrieved {len(symbols)} perpetual futures symbols",
-            symbols=symbols
+            symbols=symbols,
+            stale=stale
         )
-        return response.to_dict(), 200
+        return make_conditional_response(response.to_dict(), [symbols, stale], SYMBOLS_CACHE_TTL, stale=stale)
         
     except Exception as e:
-        logger.error(f"Error fetching symbols: {e}")
+        logger.error("Error fetching symbols: %s", e)
         return create_error_response(f"Failed to fetch symbols: {str(e)}", 500)
     
+def get_perp_tradingview_string(symbols):
+    """
+    Convert symbols to a comma-separated TradingView perpetual futures string.
+    The result is reused for as long as the symbol cache returns the same list.
+
+    :param symbols: List of symbols from get_futures_symbols()
+    :return: String such as 'BINANCE:BTCUSDT.P,BINANCE:ETHUSDT.P'
+    """
+    global _perp_tv_cache
+
+    cached_symbols, output_txt = _perp_tv_cache
+    if cached_symbols is not symbols:
+        output_txt = ",".join(map("BINANCE:{}.P".format, symbols))
+        _perp_tv_cache = (symbols, output_txt)
+    return output_txt
+
+
 @app.route('/api/symbols/perp-tradingview', methods=['GET'])
 def get_symbols_perp():
     """Get list of available trading symbols in TradingView perpetual futures format."""
@@ -106,79 +393,141 @@ def get_symbols_perp():
         if not symbols:
             return create_error_response("Failed to fetch symbols from Binance", 503)
 
-        # Convert to TradingView perpetual futures format
-        perp_symbols = [f"BINANCE:{symbol}.P" for symbol in symbols]
-        output_txt = ",".join(perp_symbols)
-
-        return Response(output_txt, mimetype='text/plain'), 200
+        response = Response(get_perp_tradingview_string(symbols), mimetype='text/plain')
+        if is_symbols_cache_stale():
+            response.headers['Warning'] = STALE_WARNING
+        return response, 200
 
     except Exception as e:
-        logger.error(f"Error fetching perp symbols: {e}")
+        logger.error("Error fetching perp symbols: %s", e)
         return create_error_response(f"Failed to fetch perp symbols: {str(e)}", 500)
 
 
 @app.route('/api/intervals', methods=['GET'])
 def get_intervals():
     """Get list of supported timeframes."""
-    supported_intervals = ['1m', '5m', '1h', '1d']
-    
-    response = IntervalsResponse(
-        success=True,
-        message=f"Retrieved {len(supported_intervals)} supported intervals",
-        intervals=supported_intervals
-    )
-    return response.to_dict(), 200
+    payload = dict(_INTERVALS_PAYLOAD, timestamp=current_timestamp())
+    return make_conditional_response(payload, _INTERVALS_PAYLOAD['data']['intervals'], 3600)
+
+
+def prepare_fetch(data):
+    """
+    Build and validate a FetchRequest from a request body.
+
+    :param data: Parsed JSON object describing the fetch
+    :return: tuple (fetch_request, error_message); fetch_request is None when invalid
+    """
+    if not isinstance(data, dict) or not data:
+        return None, "Request body cannot be empty"
+
+    # Create and validate request model
+    fetch_request, error_message = parse_fetch_request(data)
+    if not fetch_request:
+        return None, error_message
+
+    # Validate symbols if provided
+    if fetch_request.symbols:
+        valid_symbols = validate_symbols(fetch_request.symbols)
+        if not valid_symbols:
+            return None, "No valid symbols provided"
+        fetch_request.symbols = valid_symbols
+
+    # Validate intervals
+    valid_intervals = validate_intervals(fetch_request.intervals)
+    if not valid_intervals:
+        return None, "No valid intervals provided"
+    fetch_request.intervals = valid_intervals
+
+    return fetch_request, ""
+
+
+def create_request_summary(fetch_request):
+    """
+    Assign a fetch ID to a validated request and summarize it.
+
+    :param fetch_request: Validated FetchRequest
+    :return: Request summary dictionary including the fetch ID
+    """
+    # Generate fetch ID; next() on itertools.count is atomic, so IDs never collide across threads
+    fetch_id = f"fetch_{next(fetch_counter)}_{int(time.time())}"
+
+    return {
+        'fetch_id': fetch_id,
+        'symbols': fetch_request.symbols if fetch_request.symbols else "ALL_PERPETUAL_FUTURES",
+        'symbol_count': len(fetch_request.symbols) if fetch_request.symbols else "ALL",
+        'intervals': fetch_request.intervals,
+        'start_date': fetch_request.start_date,
+        'end_date': fetch_request.end_date or 'today',
+        'data_type': fetch_request.data_type,
+        'dry_run': fetch_request.dry_run
+    }
+
+
+def get_dedupe_key(request_summary):
+    """
+    Hash the parameters that determine what a fetch downloads.
+    Symbol and interval lists are sorted first, so their order does not matter.
+
+    :param request_summary: Summary returned by create_request_summary
+    :return: Hex digest identifying identical fetches
+    """
+    params = {
+        key: sorted(value) if isinstance(value, list) else value
+        for key, value in request_summary.items() if key not in ('fetch_id', 'dry_run')
+    }
+    return hashlib.sha1(orjson.dumps(params, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+def submit_fetch(fetch_request, request_summary):
+    """
+    Queue a fetch on the background executor, unless an identical fetch is
+    already queued or running, in which case that fetch is reused.
+
+    :param fetch_request: Validated FetchRequest
+    :param request_summary: Summary returned by create_request_summary
+    :return: tuple (request_summary, is_new) of the fetch that will serve the request
+    """
+    fetch_id = request_summary['fetch_id']
+    dedupe_key = get_dedupe_key(request_summary)
+
+    with _in_flight_lock:
+        existing_id = _in_flight.get(dedupe_key)
+        if existing_id is not None:
+            logger.info("Fetch %s matches in-flight fetch %s; reusing it", fetch_id, existing_id)
+            return active_fetches.get(existing_id)['request'], False
+        # Registered under the same lock, so a visible dedupe key always has its registry entry
+        _in_flight[dedupe_key] = fetch_id
+        active_fetches.add(fetch_id, {
+            'queued_at': datetime.utcnow().isoformat(),
+            'request': request_summary
+        })
+
+    evict_finished_fetches()
+    future = executor.submit(run_fetch, fetch_id, fetch_request, fetch_request.intervals)
+    active_fetches.update(fetch_id, future=future)
+    future.add_done_callback(lambda f: _on_fetch_done(fetch_id, dedupe_key, f))
+    return request_summary, True
 
 
 @app.route('/api/fetch', methods=['POST'])
 def start_fetch():
     """Start a historical data fetch."""
-    global fetch_counter
-    
     try:
         # Parse request data
         if not request.is_json:
             return create_error_response("Request must be JSON", 400)
         
-        data = request.get_json()
-        if not data:
-            return create_error_response("Request body cannot be empty", 400)
-        
-        # Create and validate request model
-        fetch_request = FetchRequest(data)
-        is_valid, error_message = fetch_request.validate()
+        data = request.get_json(cache=False, silent=True)
+        if data is None:
+            return create_error_response("Request body must be valid JSON", 400)
         
-        if not is_valid:
+        fetch_request, error_message = prepare_fetch(data)
+        if not fetch_request:
             return create_error_response(error_message, 400)
         
-        # Validate symbols if provided
-        if fetch_request.symbols:
-            valid_symbols = validate_symbols(fetch_request.symbols)
-            if not valid_symbols:
-                return create_error_response("No valid symbols provided", 400)
-            fetch_request.symbols = valid_symbols
-        
-        # Validate intervals
-        valid_intervals = validate_intervals(fetch_request.intervals)
-        if not valid_intervals:
-            return create_error_response("No valid intervals provided", 400)
-        fetch_request.intervals = valid_intervals
-        
-        # Generate fetch ID
-        fetch_counter += 1
-        fetch_id = f"fetch_{fetch_counter}_{int(datetime.utcnow().timestamp())}"
-        
         # Prepare request summary
-        request_summary = {
-            'fetch_id': fetch_id,
-            'symbols': fetch_request.symbols if fetch_request.symbols else "ALL_PERPETUAL_FUTURES",
-            'symbol_count': len(fetch_request.symbols) if fetch_request.symbols else "ALL",
-            'intervals': valid_intervals,
-            'start_date': fetch_request.start_date,
-            'end_date': fetch_request.end_date or 'today',
-            'data_type': fetch_request.data_type,
-            'dry_run': fetch_request.dry_run
-        }
+        request_summary = create_request_summary(fetch_request)
+        fetch_id = request_summary['fetch_id']
         
         # Handle dry run mode
         if fetch_request.dry_run:
@@ -189,73 +538,206 @@ def start_fetch():
             )
             return response.to_dict(), 200
         
-        # Start the fetch in a background thread
-        def run_fetch():
-            try:
-                logger.info(f"Starting fetch {fetch_id}")
-                active_fetches[fetch_id] = {
-                    'status': 'running',
-                    'started_at': datetime.utcnow().isoformat(),
-                    'request': request_summary
-                }
-                
-                # Initialize rate limiter
-                rate_limiter = initialize_rate_limiter()
-                
-                # Start the historical data fetch
-                fetch_and_insert_all_historical_data(
-                    rate_limiter=rate_limiter,
-                    symbols=fetch_request.symbols,
-                    intervals=valid_intervals,
-                    start_date=fetch_request.start_date,
-                    end_date=fetch_request.end_date,
-                    data_type=fetch_request.data_type
-                )
-                
-                # Update status on completion
-                active_fetches[fetch_id]['status'] = 'completed'
-                active_fetches[fetch_id]['completed_at'] = datetime.utcnow().isoformat()
-                logger.info(f"Fetch {fetch_id} completed successfully")
-                
-            except Exception as e:
-                logger.error(f"Fetch {fetch_id} failed: {e}")
-                active_fetches[fetch_id]['status'] = 'failed'
-                active_fetches[fetch_id]['error'] = str(e)
-                active_fetches[fetch_id]['failed_at'] = datetime.utcnow().isoformat()
-        
-        # Start the background thread
-        fetch_thread = threading.Thread(target=run_fetch, daemon=True)
-        fetch_thread.start()
+        # Queue the fetch on the background executor
+        request_summary, is_new = submit_fetch(fetch_request, request_summary)
+        fetch_id = request_summary['fetch_id']
         
         # Return immediate response
+        if is_new:
+            message = f"Historical data fetch started successfully with ID: {fetch_id}"
+        else:
+            message = f"Identical historical data fetch already in progress with ID: {fetch_id}"
         response = FetchResponse(
             success=True,
-            message=f"Historical data fetch started successfully with ID: {fetch_id}",
+            message=message,
             request_summary=request_summary
         )
         return response.to_dict(), 202  # 202 Accepted for async operation
         
+    except HTTPException:
+        raise  # e.g. 413 for oversized bodies, rendered by the error handlers
     except Exception as e:
-        logger.error(f"Error starting fetch: {e}")
+        logger.error("Error starting fetch: %s", e)
         return create_error_response(f"Failed to start fetch: {str(e)}", 500)
 
 
+@app.route('/api/fetch/batch', methods=['POST'])
+def start_fetch_batch():
+    """Start several historical data fetches in a single call."""
+    try:
+        # Parse request data
+        if not request.is_json:
+            return create_error_response("Request must be JSON", 400)
+        
+        data = request.get_json(cache=False, silent=True)
+        fetch_requests = data.get('requests') if isinstance(data, dict) else None
+        if not isinstance(fetch_requests, list) or not fetch_requests:
+            return create_error_response("'requests' must be a non-empty list of fetch requests", 400)
+        
+        if len(fetch_requests) > MAX_BATCH_SIZE:
+            return create_error_response(
+                f"Too many requests in batch: {len(fetch_requests)}. Maximum is {MAX_BATCH_SIZE}.", 400
+            )
+        
+        results = []
+        for index, item in enumerate(fetch_requests):
+            fetch_request, error_message = prepare_fetch(item)
+            if not fetch_request:
+                results.append({'index': index, 'success': False, 'message': error_message})
+                continue
+            
+            request_summary = create_request_summary(fetch_request)
+            if fetch_request.dry_run:
+                status = 'dry_run'
+            else:
+                request_summary, is_new = submit_fetch(fetch_request, request_summary)
+                status = 'queued' if is_new else 'duplicate'
+            results.append({
+                'index': index,
+                'success': True,
+                'fetch_id': request_summary['fetch_id'],
+                'status': status,
+                'request_summary': request_summary
+            })
+        
+        accepted = sum(1 for result in results if result['success'])
+        response = ApiResponse(
+            success=accepted > 0,
+            message=f"Accepted {accepted} of {len(results)} fetch requests",
+            data={'results': results, 'count': len(results)}
+        )
+        return response.to_dict(), 202 if accepted else 400
+        
+    except HTTPException:
+        raise  # e.g. 413 for oversized bodies, rendered by the error handlers
+    except Exception as e:
+        logger.error("Error starting batch fetch: %s", e)
+        return create_error_response(f"Failed to start batch fetch: {str(e)}", 500)
+
+
 @app.route('/api/fetch/<fetch_id>/status', methods=['GET'])
 def get_fetch_status(fetch_id):
     """Get status of a specific fetch operation."""
-    if fetch_id not in active_fetches:
+    fetch_info = get_fetch_info(fetch_id)
+    if fetch_info is None:
         return create_error_response(f"Fetch ID {fetch_id} not found", 404)
     
-    fetch_info = active_fetches[fetch_id]
     return create_success_response(f"Fetch {fetch_id} status", fetch_info)
 
 
+@app.route('/api/fetch/<fetch_id>/events', methods=['GET'])
+def stream_fetch_events(fetch_id):
+    """Stream status changes of a fetch operation as server-sent events."""
+    if fetch_id not in active_fetches:
+        return create_error_response(f"Fetch ID {fetch_id} not found", 404)
+    
+    if not _event_stream_slots.acquire(blocking=False):
+        return create_error_response(
+            f"Too many open event streams. Maximum is {MAX_EVENT_STREAMS}; try again later.", 503
+        )
+    
+    def generate():
+        last_status = None
+        while True:
+            version = active_fetches.version
+            fetch_info = get_fetch_info(fetch_id)
+            if fetch_info is None:
+                return  # Evicted after finishing
+            if fetch_info['status'] != last_status:
+                last_status = fetch_info['status']
+                yield f"data: {orjson.dumps(fetch_info, default=str).decode()}\n\n"
+            if last_status in ('completed', 'failed'):
+                return
+            if not active_fetches.wait_for_change(version, timeout=EVENT_STREAM_KEEPALIVE):
+                yield ": keep-alive\n\n"
+    
+    response = Response(stream_with_context(generate()), mimetype='text/event-stream',
+                        headers={'Cache-Control': 'no-cache'})
+    # Runs when the server closes the response, whether or not the stream was ever iterated
+    response.call_on_close(_event_stream_slots.release)
+    return response
+
+
+def is_list_of_strings(value):
+    """Return True if value is a list whose items are all strings."""
+    return isinstance(value, list) and all(isinstance(item, str) for item in value)
+
+
+@sock.route('/ws/fetch')
+def fetch_events_websocket(ws):
+    """
+    Push status changes for any number of fetch operations over one WebSocket.
+
+    Clients send {"subscribe": [fetch_id, ...]} or {"unsubscribe": [...]}; the server
+    replies with the fetch status object on every transition of a subscribed fetch.
+    Subscriptions end automatically once a fetch completes or fails. Beyond MAX_EVENT_STREAMS
+    open streams the socket is closed with code 1013 (try again later).
+    """
+    if not _event_stream_slots.acquire(blocking=False):
+        ws.close(reason=WS_CLOSE_TRY_AGAIN_LATER, message=f"Too many open event streams (maximum {MAX_EVENT_STREAMS})")
+        return
+    try:
+        watch_fetches(ws)
+    finally:
+        _event_stream_slots.release()
+
+
+def watch_fetches(ws):
+    """
+    Serve subscribe/unsubscribe commands and push status changes on one WebSocket until it closes.
+
+    :param ws: WebSocket connection
+    """
+    last_sent = {}  # fetch_id -> last status sent to the client
+    
+    while True:
+        version = active_fetches.version
+        
+        # Drain pending client messages without blocking
+        message = ws.receive(timeout=0)
+        while message is not None:
+            try:
+                command = orjson.loads(message)
+                subscribe = command.get('subscribe', [])
+                unsubscribe = command.get('unsubscribe', [])
+            except (orjson.JSONDecodeError, AttributeError):
+                ws.send(orjson.dumps({'error': 'Messages must be JSON objects'}).decode())
+            else:
+                if not is_list_of_strings(subscribe) or not is_list_of_strings(unsubscribe):
+                    ws.send(orjson.dumps({'error': "'subscribe' and 'unsubscribe' must be lists of fetch IDs"}).decode())
+                else:
+                    for fetch_id in subscribe:
+                        if fetch_id in active_fetches:
+                            last_sent.setdefault(fetch_id, None)
+                        else:
+                            ws.send(orjson.dumps({'fetch_id': fetch_id, 'error': 'not found'}).decode())
+                    for fetch_id in unsubscribe:
+                        last_sent.pop(fetch_id, None)
+            message = ws.receive(timeout=0)
+        
+        # Send every subscribed fetch whose status changed
+        for fetch_id in list(last_sent):
+            fetch_info = get_fetch_info(fetch_id)
+            if fetch_info is None:
+                del last_sent[fetch_id]  # Evicted after finishing
+                continue
+            if fetch_info['status'] != last_sent[fetch_id]:
+                last_sent[fetch_id] = fetch_info['status']
+                ws.send(orjson.dumps(dict(fetch_info, fetch_id=fetch_id), default=str).decode())
+            if fetch_info['status'] in ('completed', 'failed'):
+                del last_sent[fetch_id]
+        
+        active_fetches.wait_for_change(version, timeout=WEBSOCKET_POLL_INTERVAL)
+
+
 @app.route('/api/fetch/active', methods=['GET'])
 def get_active_fetches():
     """Get list of all active fetch operations."""
-    return create_success_response(f"Found {len(active_fetches)} fetch operations", {
-        'fetches': active_fetches,
-        'count': len(active_fetches)
+    fetches = {fetch_id: get_fetch_info(fetch_id) for fetch_id in active_fetches.ids()}
+    fetches = {fetch_id: info for fetch_id, info in fetches.items() if info is not None}
+    return create_success_response(f"Found {len(fetches)} fetch operations", {
+        'fetches': fetches,
+        'count': len(fetches)
     })
 
 
@@ -265,27 +747,37 @@ def not_found(error):
     return create_error_response("Endpoint not found", 404)
 
 
+@app.errorhandler(413)
+def request_too_large(error):
+    """Handle request bodies larger than MAX_CONTENT_LENGTH."""
+    return create_error_response(f"Request body too large. Maximum is {MAX_REQUEST_BYTES} bytes.", 413)
+
+
 @app.errorhandler(500)
 def internal_error(error):
     """Handle 500 errors."""
-    logger.error(f"Internal server error: {error}")
+    logger.error("Internal server error: %s", error)
     return create_error_response("Internal server error", 500)
 
 
 if __name__ == '__main__':
+    setup_logging()
     logger.info("Starting Historical Data Fetcher API...")
     logger.info("Available endpoints:")
     logger.info("  POST /api/fetch - Start a historical data fetch")
+    logger.info("  POST /api/fetch/batch - Start several historical data fetches")
     logger.info("  GET /api/symbols - Get available trading symbols")
     logger.info("  GET /api/symbols/perp-tradingview - Convert symbols to perpetual futures format")
     logger.info("  GET /api/intervals - Get supported timeframes")
     logger.info("  GET /api/health - Health check")
     logger.info("  GET /api/fetch/<id>/status - Get fetch status")
+    logger.info("  GET /api/fetch/<id>/events - Stream fetch status changes")
+    logger.info("  WS  /ws/fetch - Subscribe to status changes of several fetches")
     logger.info("  GET /api/fetch/active - Get active fetches")
     
     # Get port from environment variable or use 5001 as default
     port = int(os.environ.get('FLASK_PORT', 5001))
-    logger.info(f"Starting Flask web server on 0.0.0.0:{port}...")
+    logger.info("Starting Flask web server on 0.0.0.0:%s...", port)
 
     # Run the Flask app
     app.run(host='0.0.0.0', port=port, debug=False)
@@ -4,92 +4,102 @@ API Models and Validation for Historical Data Fetcher API
 This module contains request/response models and validation logic for the Flask API.
 """
 
-from datetime import datetime, timezone
-from typing import List, Optional, Tuple
+from datetime import date, datetime, timezone
+from typing import List, Literal, Optional, Tuple, get_args
 import logging
+import re
+
+import msgspec
+from flask import g, has_request_context
 
 logger = logging.getLogger(__name__)
 
-class FetchRequest:
-    """Model for historical data fetch request."""
-    
-    def __init__(self, data: dict):
-        self.symbols = data.get('symbols')
-        self.all_symbols = data.get('all_symbols', False)
-        self.intervals = data.get('intervals', ['1m'])
-        self.start_date = data.get('start_date', '2019-12-31')
-        self.end_date = data.get('end_date')
-        self.data_type = data.get('data_type', 'um')
-        self.dry_run = data.get('dry_run', False)
-    
-    def validate(self) -> Tuple[bool, str]:
-        """
-        Validate the fetch request.
-        
-        Returns:
-            tuple: (is_valid, error_message)
-        """
+# Supported timeframes, in display order
+Interval = Literal['1m', '5m', '1h', '1d']
+SUPPORTED_INTERVALS = get_args(Interval)
+
+# Maximum number of symbols accepted in a single fetch request
+MAX_SYMBOLS = 1000
+
+# YYYY-MM-DD, checked with a precompiled pattern instead of strptime
+_DATE_RE = re.compile(r'([0-9]{4})-([0-9]{2})-([0-9]{2})')
+
+def current_timestamp() -> str:
+    """
+    Return the current UTC time as an ISO string.
+    Inside a request the value is computed once and reused for the rest of that request.
+    """
+    if not has_request_context():
+        return datetime.now(timezone.utc).isoformat()
+    timestamp = getattr(g, 'request_ts', None)
+    if timestamp is None:
+        timestamp = g.request_ts = datetime.now(timezone.utc).isoformat()
+    return timestamp
+
+
+def _validate_date(date_string: str) -> bool:
+    """Validate date string format."""
+    match = _DATE_RE.fullmatch(date_string)
+    if not match:
+        return False
+    try:
+        date(int(match[1]), int(match[2]), int(match[3]))
+        return True
+    except ValueError:
+        return False
+
+
+class FetchRequest(msgspec.Struct, kw_only=True):
+    """
+    Model for historical data fetch request.
+
+    Field types (lists of strings, booleans, supported intervals and data types) are
+    checked by msgspec while converting the request body; the remaining rules run in
+    __post_init__. Build instances with parse_fetch_request().
+    """
+
+    symbols: Optional[List[str]] = None
+    all_symbols: bool = False
+    intervals: List[Interval] = msgspec.field(default_factory=lambda: ['1m'])
+    start_date: str = '2019-12-31'
+    end_date: Optional[str] = None
+    data_type: Literal['um', 'cm'] = 'um'
+    dry_run: bool = False
+
+    def __post_init__(self):
         # Validate symbol selection (mutually exclusive)
         if self.all_symbols and self.symbols:
-            return False, "Cannot specify both 'symbols' and 'all_symbols'. Choose one."
-        
+            raise ValueError("Cannot specify both 'symbols' and 'all_symbols'. Choose one.")
+
         if not self.all_symbols and not self.symbols:
-            return False, "Must specify either 'symbols' or set 'all_symbols' to true."
-        
-        if self.symbols and not isinstance(self.symbols, list):
-            return False, "'symbols' must be a list of strings."
-        
-        if self.symbols and len(self.symbols) == 0:
-            return False, "'symbols' list cannot be empty."
-        
-        # Validate intervals
-        if not isinstance(self.intervals, list):
-            return False, "'intervals' must be a list of strings."
-        
-        supported_intervals = ['1m', '5m', '1h', '1d']
-        invalid_intervals = [i for i in self.intervals if i not in supported_intervals]
-        if invalid_intervals:
-            return False, f"Invalid intervals: {invalid_intervals}. Supported: {supported_intervals}"
-        
+            raise ValueError("Must specify either 'symbols' or set 'all_symbols' to true.")
+
+        if self.symbols and len(self.symbols) > MAX_SYMBOLS:
+            raise ValueError(f"Too many symbols: {len(self.symbols)}. Maximum is {MAX_SYMBOLS}.")
+
         # Validate dates
-        if not self._validate_date(self.start_date):
-            return False, f"Invalid start_date format: {self.start_date}. Use YYYY-MM-DD format."
-        
-        if self.end_date and not self._validate_date(self.end_date):
-            return False, f"Invalid end_date format: {self.end_date}. Use YYYY-MM-DD format."
-        
-        # Validate data type
-        if self.data_type not in ['um', 'cm']:
-            return False, f"Invalid data_type: {self.data_type}. Must be 'um' or 'cm'."
-        
-        # Validate boolean fields
-        if not isinstance(self.all_symbols, bool):
-            return False, "'all_symbols' must be a boolean."
-        
-        if not isinstance(self.dry_run, bool):
-            return False, "'dry_run' must be a boolean."
-        
-        return True, ""
-    
-    def _validate_date(self, date_string: str) -> bool:
-        """Validate date string format."""
-        try:
-            datetime.strptime(date_string, '%Y-%m-%d')
-            return True
-        except (ValueError, TypeError):
-            return False
-    
+        if not _validate_date(self.start_date):
+            raise ValueError(f"Invalid start_date format: {self.start_date}. Use YYYY-MM-DD format.")
+
+        if self.end_date and not _validate_date(self.end_date):
+            raise ValueError(f"Invalid end_date format: {self.end_date}. Use YYYY-MM-DD format.")
+
     def to_dict(self) -> dict:
         """Convert request to dictionary."""
-        return {
-            'symbols': self.symbols,
-            'all_symbols': self.all_symbols,
-            'intervals': self.intervals,
-            'start_date': self.start_date,
-            'end_date': self.end_date,
-            'data_type': self.data_type,
-            'dry_run': self.dry_run
-        }
+        return msgspec.structs.asdict(self)
+
+
+def parse_fetch_request(data) -> Tuple[Optional[FetchRequest], str]:
+    """
+    Convert and validate a decoded JSON body into a FetchRequest in a single pass.
+
+    Returns:
+        tuple: (fetch_request, error_message); fetch_request is None when invalid
+    """
+    try:
+        return msgspec.convert(data, FetchRequest), ""
+    except msgspec.ValidationError as e:
+        return None, str(e)
 
 
 class ApiResponse:
@@ -99,7 +109,7 @@ class ApiResponse:
         self.success = success
         self.message = message
         self.data = data or {}
-        self.timestamp = datetime.now(timezone.utc).isoformat()
+        self.timestamp = current_timestamp()
     
     def to_dict(self) -> dict:
         """Convert response to dictionary."""
@@ -126,11 +136,12 @@ class FetchResponse(ApiResponse):
 class SymbolsResponse(ApiResponse):
     """Response model for symbols endpoint."""
     
-    def __init__(self, success: bool, message: str, symbols: Optional[List[str]] = None):
+    def __init__(self, success: bool, message: str, symbols: Optional[List[str]] = None, stale: bool = False):
         super().__init__(success, message)
         if symbols:
             self.data['symbols'] = symbols
             self.data['count'] = len(symbols)
+            self.data['stale'] = stale  # True when Binance was unreachable and the last known list is served
 
 
 class IntervalsResponse(ApiResponse):
@@ -12,20 +12,15 @@ For API usage, see api.py
 import logging
 import sys
 from datetime import datetime
-from binance_client import get_exchange_info, get_futures_symbols
+from binance_client import get_exchange_info, get_futures_symbols_set
 from rate_limiter import BinanceRateLimiter
-from config import LOG_LEVEL, LOG_FORMAT
-
-# Configure logging
-logging.basicConfig(
-    level=LOG_LEVEL,
-    format=LOG_FORMAT,
-    handlers=[
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+from api_models import SUPPORTED_INTERVALS
+
 logger = logging.getLogger(__name__)
 
+# Built once at import instead of on every validation call
+SUPPORTED_INTERVAL_SET = frozenset(SUPPORTED_INTERVALS)
+
 def initialize_rate_limiter():
     """
     Initialize the Binance rate limiter based on exchange info.
@@ -49,7 +44,8 @@ def validate_symbols(symbols):
     :return: List of valid symbols
     """
     try:
-        all_symbols = get_futures_symbols()
+        # Cached frozenset: O(1) per probe, and no set rebuild or Binance call per validation
+        all_symbols = get_futures_symbols_set()
         valid_symbols = []
         invalid_symbols = []
 
@@ -81,19 +77,18 @@ def validate_intervals(intervals):
     :param intervals: List of interval strings
     :return: List of valid intervals
     """
-    supported_intervals = ['1m', '5m', '1h', '1d']
     valid_intervals = []
     invalid_intervals = []
 
     for interval in intervals:
-        if interval in supported_intervals:
+        if interval in SUPPORTED_INTERVAL_SET:
             valid_intervals.append(interval)
         else:
             invalid_intervals.append(interval)
 
     if invalid_intervals:
         logger.warning(f"Invalid intervals (will be skipped): {invalid_intervals}")
-        logger.info(f"Supported intervals: {supported_intervals}")
+        logger.info(f"Supported intervals: {list(SUPPORTED_INTERVALS)}")
 
     if not valid_intervals:
         logger.error("No valid intervals provided!")
@@ -1,39 +1,182 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from zipfile import ZipFile
-import pandas as pd
+from io import BytesIO
+import pyarrow as pa
+from pyarrow import csv as pa_csv
+import numpy as np
 from tqdm import tqdm
 from datetime import datetime, timedelta, timezone
+import calendar
 import logging
+import os
+import shutil
+import sqlite3
+import tempfile
 import time
-from io import BytesIO
-
-from config import API_KEY, API_SECRET  # Assuming these are still needed for some API interactions
-from database import insert_futures_data, check_data_exists
+from threading import Lock, get_ident
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from collections import deque
+
+from config import (  # Assuming these are still needed for some API interactions
+    API_KEY, API_SECRET, SYMBOLS_CACHE_TTL, SYMBOL_FETCH_WORKERS, DAY_FETCH_WORKERS, HTTP_POOL_SIZE, ARCHIVE_CACHE_DIR,
+    INSERT_BATCH_ROWS, INSERT_BATCH_MS, EXCHANGE_INFO_CACHE_PATH, EXCHANGE_INFO_CACHE_TTL, MISSING_ARCHIVE_TTL,
+    ARCHIVE_CACHE_MAX_MB,
+)
+from database import KlineBatch, insert_kline_batch, get_days_with_data
 from binance.client import Client
-from binance.exceptions import BinanceAPIException
+from binance.exceptions import BinanceAPIException, BinanceRequestException
+import orjson
+
+# Shared HTTP session so keep-alive connections are reused across downloads and worker threads.
+# Every running fetch shares it, so the pool is sized for all download threads; a smaller pool
+# would discard connections on release and pay a new TLS handshake on the next download.
+# Throttled (429) and transient server errors are retried with exponential backoff; a 404 is a
+# missing archive and is returned straight away.
+DOWNLOAD_RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(['GET']),
+    raise_on_status=False,
+)
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_SIZE, max_retries=DOWNLOAD_RETRY))
+
+# Retry transient API failures with exponential backoff; 429 responses honour Retry-After.
+# The last failed response is returned rather than raised so BinanceAPIException still reports it.
+API_RETRY = Retry(
+    total=5,
+    connect=2,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(['GET']),
+    raise_on_status=False,
+)
+
+class OrjsonClient(Client):
+    """
+    Binance client that decodes API responses with orjson instead of the stdlib json module.
+    """
+
+    def _init_session(self):
+        # Mount the pooled, retrying adapter before the constructor's ping so the warmed-up
+        # connection is the one later calls reuse
+        session = super()._init_session()
+        session.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=HTTP_POOL_SIZE, max_retries=API_RETRY))
+        return session
+
+    @staticmethod
+    def _handle_response(response):
+        if not (200 <= response.status_code < 300):
+            raise BinanceAPIException(response, response.status_code, response.text)
+
+        if not response.content:
+            return {}
+
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            raise BinanceRequestException("Invalid Response: %s" % response.text)
 
 # Initialize Binance Client
-client = Client(api_key=API_KEY, api_secret=API_SECRET)
+client = OrjsonClient(api_key=API_KEY, api_secret=API_SECRET)
 
-# Configure Logger
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.INFO)  # You can set this based on your LOG_LEVEL in config
-handler = logging.StreamHandler()
-formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-handler.setFormatter(formatter)
-logger.addHandler(handler)
+
+# The constructor only pings the spot API; open a connection to the futures API as well
+try:
+    client.futures_ping()
+except Exception as e:
+    logger.warning(f"Binance futures API ping failed: {e}")
 
 # Constants
-INTERVAL_DURATION_MS = 60 * 1000  # 1 minute in milliseconds
 BASE_URL = "https://data.binance.vision/data/futures"
 
-def get_exchange_info():
+# Column layout of Binance kline archive CSVs; only the first six are stored
+KLINE_COLUMNS = [
+    'open_time', 'open', 'high', 'low', 'close', 'volume',
+    'close_time', 'quote_volume', 'count',
+    'taker_buy_volume', 'taker_buy_quote_volume', 'ignore'
+]
+KLINE_CONVERT_OPTIONS = pa_csv.ConvertOptions(
+    include_columns=KLINE_COLUMNS[:6],
+    column_types={'open_time': pa.int64(), **{name: pa.float64() for name in KLINE_COLUMNS[1:6]}},
+)
+
+# In-process copy of the exchange information as (fetched_at, exchange_info); fetched_at is the
+# wall-clock time Binance served it, so copies read from the file cache keep their age
+_exchange_info_entry = None
+
+# In-process cache of perpetual futures symbols
+_symbols_cache = None
+_symbols_set_cache = frozenset()
+_symbols_cache_ts = 0.0
+_symbols_cache_lock = Lock()
+
+def read_cached_exchange_info(max_age):
+    """
+    Read exchange information from the file cache if it is younger than max_age seconds.
+
+    :param max_age: Maximum age of the cached file in seconds
+    :return: (fetched_at, exchange_info) or None if there is no fresh cached copy
+    """
+    if not EXCHANGE_INFO_CACHE_PATH:
+        return None
+    try:
+        fetched_at = os.path.getmtime(EXCHANGE_INFO_CACHE_PATH)
+        if time.time() - fetched_at >= max_age:
+            return None
+        with open(EXCHANGE_INFO_CACHE_PATH, 'rb') as cache_file:
+            return fetched_at, orjson.loads(cache_file.read())
+    except FileNotFoundError:
+        return None
+    except (OSError, orjson.JSONDecodeError) as e:
+        logger.warning(f"Ignoring unreadable exchange info cache {EXCHANGE_INFO_CACHE_PATH}: {e}")
+        return None
+
+def write_cached_exchange_info(exchange_info):
+    """
+    Store exchange information in the file cache, replacing any previous copy atomically.
+
+    :param exchange_info: Exchange information returned by Binance
+    """
+    if not EXCHANGE_INFO_CACHE_PATH:
+        return
+    try:
+        cache_dir = os.path.dirname(os.path.abspath(EXCHANGE_INFO_CACHE_PATH))
+        with tempfile.NamedTemporaryFile('wb', dir=cache_dir, suffix='.part', delete=False) as part_file:
+            part_file.write(orjson.dumps(exchange_info))
+        os.replace(part_file.name, EXCHANGE_INFO_CACHE_PATH)
+    except OSError as e:
+        logger.warning(f"Could not cache exchange info at {EXCHANGE_INFO_CACHE_PATH}: {e}")
+
+def get_exchange_info(max_age=EXCHANGE_INFO_CACHE_TTL):
     """
     Retrieve exchange information, including rate limits.
+    A copy younger than max_age seconds is served from memory or the file cache instead of calling Binance.
+
+    :param max_age: Maximum age in seconds of a cached copy
     """
+    global _exchange_info_entry
+
+    entry = _exchange_info_entry
+    if entry is not None and time.time() - entry[0] < max_age:
+        return entry[1]
+
+    entry = read_cached_exchange_info(max_age)
+    if entry is not None:
+        logger.debug("Using cached exchange information.")
+        _exchange_info_entry = entry
+        return entry[1]
+
     try:
         exchange_info = client.futures_exchange_info()
         logger.debug("Fetched exchange information from Binance.")
+        _exchange_info_entry = (time.time(), exchange_info)
+        write_cached_exchange_info(exchange_info)
         return exchange_info
     except BinanceAPIException as e:
         logger.error(f"Error fetching exchange info: {e}")
@@ -45,15 +188,49 @@ def get_exchange_info():
 def get_futures_symbols():
     """
     Retrieve all perpetual futures symbols from Binance.
+    Results are cached for SYMBOLS_CACHE_TTL seconds. If Binance cannot be reached,
+    the last known list is returned instead.
     """
-    try:
-        exchange_info = get_exchange_info()
-        symbols = [s['symbol'] for s in exchange_info['symbols'] if s['contractType'] == 'PERPETUAL']
-        logger.info(f"Retrieved {len(symbols)} perpetual futures symbols.")
-        return symbols
-    except Exception as e:
-        logger.error(f"Error fetching futures symbols: {e}")
-        return []
+    global _symbols_cache, _symbols_set_cache, _symbols_cache_ts
+
+    with _symbols_cache_lock:
+        if _symbols_cache is not None and time.monotonic() - _symbols_cache_ts < SYMBOLS_CACHE_TTL:
+            logger.debug(f"Using cached list of {len(_symbols_cache)} perpetual futures symbols.")
+            return _symbols_cache
+
+        try:
+            exchange_info = get_exchange_info(max_age=SYMBOLS_CACHE_TTL)
+            symbols = [s['symbol'] for s in exchange_info['symbols'] if s['contractType'] == 'PERPETUAL']
+            logger.info(f"Retrieved {len(symbols)} perpetual futures symbols.")
+            _symbols_cache = symbols
+            _symbols_set_cache = frozenset(symbols)
+            _symbols_cache_ts = time.monotonic()
+            return symbols
+        except Exception as e:
+            logger.error(f"Error fetching futures symbols: {e}")
+            if _symbols_cache is not None:
+                logger.warning(f"Serving stale list of {len(_symbols_cache)} perpetual futures symbols.")
+                return _symbols_cache
+            return []
+
+def is_symbols_cache_stale():
+    """
+    Tell whether the cached symbol list is past SYMBOLS_CACHE_TTL, i.e. get_futures_symbols()
+    could not refresh it and served the last known list.
+    """
+    with _symbols_cache_lock:
+        return _symbols_cache is not None and time.monotonic() - _symbols_cache_ts >= SYMBOLS_CACHE_TTL
+
+def get_futures_symbols_set():
+    """
+    Retrieve all perpetual futures symbols as a frozenset for O(1) membership checks.
+    The set is built once per symbol cache refresh.
+    """
+    symbols = get_futures_symbols()
+    with _symbols_cache_lock:
+        if symbols is _symbols_cache:
+            return _symbols_set_cache
+    return frozenset(symbols)
 
 def generate_date_range(start_date_str='2019-12-31', end_date_str=None):
     """
@@ -83,40 +260,345 @@ def generate_date_range(start_date_str='2019-12-31', end_date_str=None):
         logger.error(f"Start date {start_date_str} is after end date {end_date}")
         return []
 
-    delta = end_date - start_date
-    dates = [(start_date + timedelta(days=i)).strftime('%Y-%m-%d') for i in range(delta.days + 1)]
+    # One vectorised range of calendar days; datetime64[D] renders as 'YYYY-MM-DD'
+    dates = np.arange(start_date, end_date + timedelta(days=1), dtype='datetime64[D]').astype(str).tolist()
     logger.debug(f"Generated date range from {start_date_str} to {end_date}. Total days: {len(dates)}")
     return dates
 
-def download_and_extract_zip_streaming(symbol, interval, date, data_type='um'):
+def download_and_extract_zip_streaming(symbol, interval, date, data_type='um', rate_limiter=None):
     """
     Download and extract the ZIP file for a given symbol, interval, and date using in-memory streaming.
-    Checks database first to avoid re-downloading existing data.
 
     :param symbol: Trading symbol, e.g., 'ADABUSD'
     :param interval: Kline interval, e.g., '1m'
     :param date: Date string in 'YYYY-MM-DD' format
     :param data_type: 'um' for USD-M Futures, 'cm' for COIN-M Futures
-    :return: DataFrame containing the klines data or None if download/extraction fails
+    :param rate_limiter: Rate limiter charged if the archive has to be downloaded
+    :return: KlineBatch with the klines data or None if download/extraction fails
     """
-    # Check if data already exists in database
-    try:
-        if check_data_exists(symbol, date, interval):
-            logger.debug(f"Data already exists in database for {symbol} on {date} ({interval}). Skipping download.")
-            return None
-    except Exception as e:
-        logger.warning(f"Could not check if data exists for {symbol} on {date} ({interval}): {e}. Proceeding with download.")
-
     # Construct download URL
     url = f"{BASE_URL}/{data_type}/daily/klines/{symbol}/{interval}/{symbol}-{interval}-{date}.zip"
+    return download_zip_csv(url, symbol, interval, date, rate_limiter)
+
+def download_monthly_zip_streaming(symbol, interval, month, data_type='um', rate_limiter=None):
+    """
+    Download and extract the monthly archive for a given symbol and interval using in-memory streaming.
+    One monthly archive replaces up to 31 daily downloads.
+
+    :param symbol: Trading symbol, e.g., 'ADABUSD'
+    :param interval: Kline interval, e.g., '1m'
+    :param month: Month string in 'YYYY-MM' format
+    :param data_type: 'um' for USD-M Futures, 'cm' for COIN-M Futures
+    :param rate_limiter: Rate limiter charged if the archive has to be downloaded
+    :return: KlineBatch with the klines data or None if download/extraction fails
+    """
+    url = f"{BASE_URL}/{data_type}/monthly/klines/{symbol}/{interval}/{symbol}-{interval}-{month}.zip"
+    return download_zip_csv(url, symbol, interval, month, rate_limiter)
+
+# Archive downloads a symbol keeps in flight ahead of its inserts
+PREFETCH_DEPTH = 2 * DAY_FETCH_WORKERS
+
+# Bytes copied per read when streaming an archive to disk or a spool file
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Uncached downloads whose Content-Length is up to this size are kept in memory; larger ones,
+# or ones of unknown size, are written to an anonymous temporary file
+ARCHIVE_SPOOL_SIZE = 8 * 1024 * 1024
+
+# Names of the archives in each cache directory, listed once per process with os.scandir;
+# None marks a directory that does not exist yet
+_cached_archive_names = {}
+_cached_archive_lock = Lock()
+
+# SQLite index kept next to the cached archives. It records each cached archive's size and last
+# use, so the cache can be held under ARCHIVE_CACHE_MAX_MB by evicting the least recently used
+# archives, and the archives that returned 404, so later runs skip them. Daily files are
+# published the day after, so recent periods are never recorded as missing.
+CACHE_INDEX_NAME = 'index.sqlite'
+MISSING_GRACE_DAYS = 2
+# Eviction frees space down to this fraction of the limit, so it does not run on every download
+CACHE_EVICTION_TARGET = 0.9
+_cache_index = None
+_cache_index_loaded = False
+_cache_bytes = 0
+_missing_archives = {}
+_cache_index_lock = Lock()
+
+def get_archive_cache_path(url, period):
+    """
+    Map an archive URL to its location in the local archive cache.
+    Archives are sharded by year below the URL's directory, so no directory grows past a few hundred files.
+
+    :param url: Archive URL on data.binance.vision
+    :param period: Date or month covered by the archive
+    :return: Path mirroring the URL below ARCHIVE_CACHE_DIR, or None when caching is disabled
+    """
+    if not ARCHIVE_CACHE_DIR:
+        return None
+    directory, name = os.path.split(url[len(BASE_URL) + 1:])
+    return os.path.join(ARCHIVE_CACHE_DIR, directory, period[:4], name)
+
+def cached_archive_names(directory):
+    """
+    Return the names of the archives cached in a directory.
+    Each directory is listed once per process; later lookups and additions use the in-memory set.
+    The caller must hold _cached_archive_lock.
+
+    :param directory: Cache directory holding one year of a symbol's archives for an interval
+    :return: Set of archive file names, or None if the directory does not exist yet
+    """
+    if directory not in _cached_archive_names:
+        try:
+            with os.scandir(directory) as entries:
+                _cached_archive_names[directory] = {entry.name for entry in entries if entry.name.endswith('.zip')}
+        except FileNotFoundError:
+            _cached_archive_names[directory] = None
+    return _cached_archive_names[directory]
+
+def is_archive_cached(cache_path):
+    """
+    Check whether an archive is in the local archive cache without touching the filesystem again.
+
+    :param cache_path: Cache location returned by get_archive_cache_path
+    :return: True if the archive is cached
+    """
+    directory, name = os.path.split(cache_path)
+    with _cached_archive_lock:
+        names = cached_archive_names(directory)
+        return names is not None and name in names
+
+def store_cached_archive(part_path, cache_path):
+    """
+    Move a fully downloaded archive into the cache, creating its directory on first use.
+
+    :param part_path: Temporary file holding the complete archive
+    :param cache_path: Cache location returned by get_archive_cache_path
+    """
+    directory, name = os.path.split(cache_path)
+    os.replace(part_path, cache_path)
+    with _cached_archive_lock:
+        names = cached_archive_names(directory)
+        if names is None:
+            names = _cached_archive_names[directory] = set()
+        names.add(name)
+
+def forget_cached_archive(cache_path):
+    """
+    Drop an archive from the in-memory cache listing after it was evicted or found missing.
+
+    :param cache_path: Cache location returned by get_archive_cache_path
+    """
+    directory, name = os.path.split(cache_path)
+    with _cached_archive_lock:
+        names = _cached_archive_names.get(directory)
+        if names:
+            names.discard(name)
+
+def ensure_cache_directory(cache_path):
+    """
+    Create the directory of a cache location unless it is already known to exist.
+
+    :param cache_path: Cache location returned by get_archive_cache_path
+    """
+    directory = os.path.dirname(cache_path)
+    with _cached_archive_lock:
+        if cached_archive_names(directory) is not None:
+            return
+    os.makedirs(directory, exist_ok=True)
+
+def open_cache_index():
+    """
+    Open the archive cache index on first use and load the cache size and recent 404s from it.
+    The caller must hold _cache_index_lock.
+
+    :return: SQLite connection, or None when caching is disabled or the index cannot be opened
+    """
+    global _cache_index, _cache_index_loaded, _cache_bytes
+
+    if _cache_index_loaded or not ARCHIVE_CACHE_DIR:
+        return _cache_index
+    _cache_index_loaded = True
+    try:
+        os.makedirs(ARCHIVE_CACHE_DIR, exist_ok=True)
+        index = sqlite3.connect(os.path.join(ARCHIVE_CACHE_DIR, CACHE_INDEX_NAME), check_same_thread=False)
+        index.execute("PRAGMA journal_mode=WAL")
+        index.execute("PRAGMA synchronous=NORMAL")
+        with index:
+            index.execute("CREATE TABLE IF NOT EXISTS missing (url TEXT PRIMARY KEY, checked_at REAL NOT NULL)")
+            index.execute(
+                "CREATE TABLE IF NOT EXISTS archives (path TEXT PRIMARY KEY, size INTEGER NOT NULL, last_used REAL NOT NULL)"
+            )
+            index.execute("CREATE INDEX IF NOT EXISTS archives_last_used ON archives (last_used)")
+        _cache_bytes = index.execute("SELECT COALESCE(SUM(size), 0) FROM archives").fetchone()[0]
+        _missing_archives.update(index.execute(
+            "SELECT url, checked_at FROM missing WHERE checked_at > ?", (time.time() - MISSING_ARCHIVE_TTL,)
+        ))
+        logger.debug(f"Archive cache holds {_cache_bytes} indexed bytes and {len(_missing_archives)} known missing archives.")
+        _cache_index = index
+    except (OSError, sqlite3.Error) as e:
+        logger.warning(f"Could not open the archive cache index in {ARCHIVE_CACHE_DIR}: {e}")
+    return _cache_index
+
+def touch_cached_archive(cache_path):
+    """
+    Mark a cached archive as used now, indexing it if it was cached before the index existed.
+
+    :param cache_path: Cache location returned by get_archive_cache_path
+    """
+    global _cache_bytes
+
+    path = os.path.relpath(cache_path, ARCHIVE_CACHE_DIR)
+    with _cache_index_lock:
+        index = open_cache_index()
+        if index is None:
+            return
+        try:
+            with index:
+                updated = index.execute("UPDATE archives SET last_used = ? WHERE path = ?", (time.time(), path)).rowcount
+                if not updated:
+                    size = os.path.getsize(cache_path)
+                    index.execute("INSERT INTO archives (path, size, last_used) VALUES (?, ?, ?)", (path, size, time.time()))
+                    _cache_bytes += size
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Could not update the archive cache index for {path}: {e}")
+
+def index_cached_archive(cache_path):
+    """
+    Record a newly cached archive and evict the least recently used archives if the cache is over its limit.
+
+    :param cache_path: Cache location returned by get_archive_cache_path
+    """
+    global _cache_bytes
+
+    path = os.path.relpath(cache_path, ARCHIVE_CACHE_DIR)
+    with _cache_index_lock:
+        index = open_cache_index()
+        if index is None:
+            return
+        try:
+            size = os.path.getsize(cache_path)
+            with index:
+                previous = index.execute("SELECT size FROM archives WHERE path = ?", (path,)).fetchone()
+                index.execute(
+                    "INSERT OR REPLACE INTO archives (path, size, last_used) VALUES (?, ?, ?)", (path, size, time.time())
+                )
+            _cache_bytes += size - (previous[0] if previous else 0)
+            limit = ARCHIVE_CACHE_MAX_MB * 1024 * 1024
+            if limit and _cache_bytes > limit:
+                evict_cached_archives(index, int(limit * CACHE_EVICTION_TARGET))
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Could not update the archive cache index for {path}: {e}")
+
+def evict_cached_archives(index, target_bytes):
+    """
+    Delete the least recently used archives until the cache holds at most target_bytes.
+    The caller must hold _cache_index_lock.
+
+    :param index: Open archive cache index
+    :param target_bytes: Cache size to shrink to
+    """
+    global _cache_bytes
+
+    evicted = 0
+    while _cache_bytes > target_bytes:
+        rows = index.execute("SELECT path, size FROM archives ORDER BY last_used LIMIT 256").fetchall()
+        if not rows:
+            break
+        removed = []
+        for path, size in rows:
+            if _cache_bytes <= target_bytes:
+                break
+            cache_path = os.path.join(ARCHIVE_CACHE_DIR, path)
+            try:
+                os.remove(cache_path)
+            except FileNotFoundError:
+                pass
+            forget_cached_archive(cache_path)
+            removed.append((path,))
+            _cache_bytes -= size
+        with index:
+            index.executemany("DELETE FROM archives WHERE path = ?", removed)
+        evicted += len(removed)
+    logger.info(f"Evicted {evicted} archives from the cache; {_cache_bytes} bytes remain.")
+
+def is_archive_missing(url):
+    """
+    Check whether an archive returned 404 within the last MISSING_ARCHIVE_TTL seconds.
+
+    :param url: Archive URL on data.binance.vision
+    :return: True if the archive is known to be missing
+    """
+    with _cache_index_lock:
+        open_cache_index()
+        checked_at = _missing_archives.get(url)
+    return checked_at is not None and time.time() - checked_at < MISSING_ARCHIVE_TTL
+
+def record_missing_archive(url, period):
+    """
+    Remember that an archive returned 404, unless its period may still be published.
+
+    :param url: Archive URL on data.binance.vision
+    :param period: Date or month covered by the archive
+    """
+    cutoff = (datetime.utcnow() - timedelta(days=MISSING_GRACE_DAYS)).strftime('%Y-%m-%d')
+    if period >= cutoff[:len(period)]:
+        return
+
+    checked_at = time.time()
+    with _cache_index_lock:
+        index = open_cache_index()
+        _missing_archives[url] = checked_at
+        if index is not None:
+            try:
+                with index:
+                    index.execute("INSERT OR REPLACE INTO missing (url, checked_at) VALUES (?, ?)", (url, checked_at))
+            except sqlite3.Error as e:
+                logger.warning(f"Could not record missing archive {url}: {e}")
+
+def fetch_archive(url, symbol, period, rate_limiter=None):
+    """
+    Return a kline ZIP archive, from the local cache when available.
+    Published archives never change, so downloaded files are cached without expiry.
+
+    :param url: Archive URL on data.binance.vision
+    :param symbol: Trading symbol, e.g., 'ADABUSD'
+    :param period: Date or month covered by the archive, used for logging
+    :param rate_limiter: Rate limiter charged only when the archive is actually downloaded
+    :return: Open binary file with the archive content, None if the download fails
+    """
+    cache_path = get_archive_cache_path(url, period)
+    if cache_path and is_archive_cached(cache_path):
+        # The open handle keeps the archive readable even if it is evicted before it is parsed
+        try:
+            archive = open(cache_path, 'rb')
+        except FileNotFoundError:
+            # Evicted by another worker or process since the directory was listed; download it again
+            logger.debug(f"Cached ZIP file {cache_path} is gone. Downloading it again.")
+            forget_cached_archive(cache_path)
+        else:
+            logger.debug(f"Reading ZIP file from cache {cache_path}")
+            touch_cached_archive(cache_path)
+            return archive
+
+    if cache_path and is_archive_missing(url):
+        logger.debug(f"Data file for {symbol} on {period} was recently not found. Skipping.")
+        return None
+
+    # Cache hits and known missing archives make no request, so only downloads spend the budget
+    if rate_limiter:
+        rate_limiter.acquire("REQUEST_WEIGHT")
+
     logger.debug(f"Downloading ZIP file from {url}")
 
     try:
-        response = requests.get(url, timeout=60)
+        response = SESSION.get(url, timeout=60, stream=True)
         response.raise_for_status()
     except requests.HTTPError as http_err:
+        response.close()
         if response.status_code == 404:
-            logger.warning(f"Data file not found for {symbol} on {date}. Skipping.")
+            logger.warning(f"Data file not found for {symbol} on {period}. Skipping.")
+            if cache_path:
+                record_missing_archive(url, period)
         else:
             logger.error(f"HTTP error occurred while downloading {url}: {http_err}")
         return None
@@ -124,86 +606,163 @@ def download_and_extract_zip_streaming(symbol, interval, date, data_type='um'):
         logger.error(f"Error occurred while downloading {url}: {err}")
         return None
 
-    # Process ZIP file in memory
+    with response:
+        if not cache_path:
+            # Small archives stay in memory; large monthly ones go to a temporary file. Both are seekable
+            # on every Python version, which ZipFile needs (SpooledTemporaryFile is not before 3.11)
+            length = int(response.headers.get('Content-Length') or 0)
+            spool = BytesIO() if 0 < length <= ARCHIVE_SPOOL_SIZE else tempfile.TemporaryFile()
+            try:
+                response.raw.decode_content = True
+                shutil.copyfileobj(response.raw, spool, DOWNLOAD_CHUNK_SIZE)
+            except Exception as e:
+                spool.close()
+                logger.error(f"Error occurred while downloading {url}: {e}")
+                return None
+            spool.seek(0)
+            return spool
+
+        # Stream the body straight to a temporary name, so it is never held in memory and
+        # readers never see a partial archive. The handle stays open and is returned, so the archive
+        # can be parsed even if the cache evicts it straight away
+        part_path = f"{cache_path}.{get_ident()}.part"
+        part_file = None
+        try:
+            ensure_cache_directory(cache_path)
+            part_file = open(part_path, 'w+b')
+            response.raw.decode_content = True
+            shutil.copyfileobj(response.raw, part_file, DOWNLOAD_CHUNK_SIZE)
+            part_file.flush()
+            store_cached_archive(part_path, cache_path)
+            index_cached_archive(cache_path)
+            part_file.seek(0)
+            return part_file
+        except Exception as e:
+            logger.error(f"Error occurred while downloading {url} to {cache_path}: {e}")
+            if part_file is not None:
+                part_file.close()
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            return None
+
+def download_zip_csv(url, symbol, interval, period, rate_limiter=None):
+    """
+    Download a kline ZIP archive and read the CSV it contains.
+
+    :param url: Archive URL on data.binance.vision
+    :param symbol: Trading symbol, e.g., 'ADABUSD'
+    :param interval: Kline interval, e.g., '1m'
+    :param period: Date or month covered by the archive, used for logging
+    :param rate_limiter: Rate limiter charged if the archive has to be downloaded
+    :return: KlineBatch with the klines data or None if download/extraction fails
+    """
+    archive = fetch_archive(url, symbol, period, rate_limiter)
+    if archive is None:
+        return None
+
     try:
-        # Create a BytesIO object from the response content
-        zip_buffer = BytesIO(response.content)
-
-        # Extract and read CSV directly from memory
-        with ZipFile(zip_buffer, 'r') as thezip:
-            with thezip.open(thezip.namelist()[0]) as thefile:
-                df = pd.read_csv(thefile, header=None)
-                logger.debug(f"Downloaded and extracted CSV for {symbol} on {date} ({interval}) - {len(df)} rows")
-                return df
+        # Parse the CSV as it is decompressed from the cached file or the spooled download,
+        # without extracting it into a separate buffer first
+        with ZipFile(archive, 'r') as thezip, thezip.open(thezip.namelist()[0]) as csv_file:
+            # Newer archives start with a header line; pyarrow parses the typed columns on multiple threads
+            has_header = not csv_file.peek(1)[:1].isdigit()
+            table = pa_csv.read_csv(
+                csv_file,
+                read_options=pa_csv.ReadOptions(column_names=KLINE_COLUMNS, skip_rows=int(has_header)),
+                convert_options=KLINE_CONVERT_OPTIONS,
+            )
+        # Rows with missing values are dropped; each column then maps straight onto a NumPy array
+        complete = table.drop_null()
+        if complete.num_rows < table.num_rows:
+            logger.warning(f"Skipping {table.num_rows - complete.num_rows} incomplete rows for {symbol} on {period}")
+        batch = KlineBatch(*(complete.column(name).to_numpy() for name in KLINE_COLUMNS[:6]))
+        logger.debug(f"Downloaded and extracted CSV for {symbol} on {period} ({interval}) - {complete.num_rows} rows")
+        return batch
     except Exception as e:
-        logger.error(f"Error extracting or parsing ZIP file for {symbol} on {date}: {e}")
+        logger.error(f"Error extracting or parsing ZIP file for {symbol} on {period}: {e}")
         return None
+    finally:
+        archive.close()
 
-def process_and_insert_data(symbol, df, timeframe='1m'):
+def process_and_insert_data(symbol, batch, timeframe='1m'):
     """
-    Process the DataFrame and insert data into the database.
+    Insert a batch of klines into the database in a single transaction.
 
     :param symbol: Trading symbol, e.g., 'ADABUSD'
-    :param df: DataFrame containing the klines data
+    :param batch: KlineBatch with open_time and OHLCV columns
     :param timeframe: Timeframe string (1m, 5m, 1h, 1d)
+    :return: Number of candlesticks written, 0 if there was nothing to insert or the insert failed
     """
-    if df.empty:
-        logger.debug(f"No data in DataFrame for {symbol}.")
-        return
-
-    # Define column names based on Binance's Klines data structure
-    column_names = [
-    'open_time', 'open', 'high', 'low', 'close', 'volume',
-    'close_time', 'quote_volume', 'count',
-    'taker_buy_volume', 'taker_buy_quote_volume', 'ignore'
-    ]
-    df.columns = column_names
-
-    batch_data = []
-    last_open_time = None
-
-    for _, row in df.iterrows():
-        open_time = None
-        try:
-            open_time_ms = pd.to_numeric(row['open_time'], errors='coerce')
-            open_time = datetime.fromtimestamp(open_time_ms / 1000, tz=timezone.utc)
-            last_open_time = open_time  # Keep track of the last successfully processed timestamp
-            data_point = (
-                'binance',
-                symbol,
-                open_time,
-                float(row['open']),
-                float(row['high']),
-                float(row['low']),
-                float(row['close']),
-                float(row['volume']),
-            )
-            batch_data.append(data_point)
-        except Exception as e:
-            logger.error(f"Error processing row for {symbol}: {e}")
-            continue
-
-    if not batch_data:
+    row_count = len(batch.open_time)
+    if not row_count:
         logger.debug(f"No valid data points to insert for {symbol}.")
-        return
+        return 0
+
+    # Open times stay integer milliseconds; the database converts them to timestamps
+    last_open_time = datetime.fromtimestamp(int(batch.open_time[-1]) / 1000, tz=timezone.utc)
 
-    # Insert and log, but guard against missing last_open_time
     try:
-        insert_futures_data(batch_data, timeframe)
-        if last_open_time:
-            logger.info(
-                f"Inserted {len(batch_data)} candlesticks for {symbol} "
-                f"({timeframe}) on {last_open_time.date()}."
-            )
-        else:
-            logger.info(f"Inserted {len(batch_data)} candlesticks for {symbol} ({timeframe}).")
+        insert_kline_batch(batch, symbol, timeframe)
+        logger.debug(
+            f"Inserted {row_count} candlesticks for {symbol} "
+            f"({timeframe}) through {last_open_time.date()}."
+        )
+        return row_count
     except Exception as e:
-        when = last_open_time.date() if last_open_time else "unknown date"
         logger.error(
-            f"Error inserting data for {symbol} ({timeframe}) on {when}: {e}"
+            f"Error inserting data for {symbol} ({timeframe}) through {last_open_time.date()}: {e}"
         )
+        return 0
+
+class BatchedWriter:
+    """
+    Buffers kline batches for one symbol and timeframe so several archives share one insert.
+
+    Every insert is a commit, and with daily archives that meant one WAL flush per day of data.
+    The buffer is written once it holds batch_rows rows or its oldest batch has waited batch_ms
+    milliseconds, and whatever is left is written by flush().
+    """
+
+    def __init__(self, symbol, timeframe, batch_rows=INSERT_BATCH_ROWS, batch_ms=INSERT_BATCH_MS):
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self.batch_rows = batch_rows
+        self.batch_ms = batch_ms
+        self.rows_written = 0
+        self._batches = []
+        self._rows = 0
+        self._started = None
+
+    def add(self, batch):
+        """
+        Buffer a batch and write the buffer if either bound is reached.
+
+        :param batch: KlineBatch for this writer's symbol and timeframe
+        """
+        if not len(batch.open_time):
+            return
+        if not self._batches:
+            self._started = time.monotonic()
+        self._batches.append(batch)
+        self._rows += len(batch.open_time)
+
+        if self._rows >= self.batch_rows or (time.monotonic() - self._started) * 1000 >= self.batch_ms:
+            self.flush()
+
+    def flush(self):
+        """
+        Write all buffered klines in one insert.
+        """
+        if not self._batches:
+            return
+        batches, self._batches, self._rows = self._batches, [], 0
+        if len(batches) == 1:
+            batch = batches[0]
+        else:
+            batch = KlineBatch(*(np.concatenate(column) for column in zip(*batches)))
+        self.rows_written += process_and_insert_data(self.symbol, batch, timeframe=self.timeframe)
 
-def fetch_historical_candlesticks(symbol, rate_limiter, dates, interval='1m', data_type='um'):
+def fetch_historical_candlesticks(symbol, rate_limiter, dates, interval='1m', data_type='um', progress=None):
     """
     Fetch historical candlesticks for a symbol by downloading and processing ZIP files from Binance's public data.
     Uses in-memory streaming to avoid local storage issues in Kubernetes.
@@ -213,21 +772,127 @@ def fetch_historical_candlesticks(symbol, rate_limiter, dates, interval='1m', da
     :param dates: List of date strings in 'YYYY-MM-DD' format
     :param interval: Kline interval, e.g., '1m'
     :param data_type: 'um' for USD-M Futures, 'cm' for COIN-M Futures
+    :param progress: Progress bar shared by the whole fetch, advanced by one per processed day
     """
-    for date in tqdm(dates, desc=f"Fetching {symbol} ({interval})", unit="day"):
-        try:
-            if rate_limiter:
-                rate_limiter.acquire("REQUEST_WEIGHT")
-
-            df = download_and_extract_zip_streaming(symbol, interval, date, data_type=data_type)
-            if df is not None:
-                process_and_insert_data(symbol, df, timeframe=interval)
-            else:
-                logger.debug(f"No data for {symbol} on {date}. Skipping.")
-        except Exception as e:
-            logger.error(f"Unexpected failure for {symbol} on {date} ({interval}): {e}")
-        finally:
-            time.sleep(0.1)
+    if not dates:
+        return
+
+    # One query finds the days already stored, instead of a check per archive
+    try:
+        existing_days = get_days_with_data(symbol, dates[0], dates[-1], interval)
+    except Exception as e:
+        logger.warning(f"Could not check existing data for {symbol} ({interval}): {e}. Proceeding with download.")
+        existing_days = set()
+
+    periods = list(plan_archive_periods(dates, existing_days))
+    if progress is not None:
+        progress.update(len(dates) - sum(len(period_dates) for _, period_dates in periods))
+    if not periods:
+        logger.debug(f"Data already exists in database for {symbol} ({interval}). Skipping download.")
+    writer = BatchedWriter(symbol, interval)
+
+    def fetch_period(period):
+        month, period_dates = period
+        if month:
+            batch = fetch_monthly_candlesticks(symbol, rate_limiter, month, interval, data_type)
+            if batch is not None:
+                return len(period_dates), [batch]
+        # Days without a monthly archive, or whose monthly archive is unavailable, use daily archives
+        batches = (
+            fetch_daily_candlesticks(symbol, rate_limiter, date, interval, data_type)
+            for date in period_dates if date not in existing_days
+        )
+        return len(period_dates), [batch for batch in batches if batch is not None]
+
+    # Archives are downloaded in parallel and ahead of the inserts; this thread alone writes them, in date order
+    with ThreadPoolExecutor(max_workers=DAY_FETCH_WORKERS, thread_name_prefix=f"fetch-{symbol}") as executor:
+        for days, batches in prefetch_map(executor, fetch_period, periods, PREFETCH_DEPTH):
+            for batch in batches:
+                writer.add(batch)
+            if progress is not None:
+                progress.update(days)
+
+    writer.flush()
+    logger.info(f"Inserted {writer.rows_written} candlesticks for {symbol} ({interval}).")
+
+def plan_archive_periods(dates, existing_days=frozenset()):
+    """
+    Split a date range into the archives that cover the days not stored yet.
+    Binance publishes monthly archives only for finished months, and one is used only when none
+    of its days are stored; partial ranges and partial gaps stay on daily files.
+
+    :param dates: List of date strings in 'YYYY-MM-DD' format
+    :param existing_days: Date strings that already have data in the database
+    :return: Generator of (month, dates) pairs; month is None for a single day fetched from its daily archive
+    """
+    current_month = datetime.utcnow().strftime('%Y-%m')
+    for month, month_dates in groupby(dates, key=lambda d: d[:7]):
+        month_dates = list(month_dates)
+        missing_dates = [date for date in month_dates if date not in existing_days]
+        if not missing_dates:
+            continue
+        days_in_month = calendar.monthrange(int(month[:4]), int(month[5:]))[1]
+        if month < current_month and len(month_dates) == days_in_month and len(missing_dates) == days_in_month:
+            yield month, month_dates
+        else:
+            for date in missing_dates:
+                yield None, [date]
+
+def prefetch_map(executor, fn, items, depth):
+    """
+    Like executor.map, but submits at most depth calls ahead of the consumer so finished
+    results cannot pile up in memory while inserts are slower than downloads.
+
+    :param executor: Executor that runs the calls
+    :param fn: Function applied to each item
+    :param items: Iterable of items
+    :param depth: Maximum number of calls in flight
+    :return: Generator of results, in the order of items
+    """
+    pending = deque()
+    for item in items:
+        pending.append(executor.submit(fn, item))
+        if len(pending) >= depth:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+def fetch_daily_candlesticks(symbol, rate_limiter, date, interval='1m', data_type='um'):
+    """
+    Fetch one day of candlesticks from its daily archive.
+
+    :param symbol: Trading symbol, e.g., 'ADABUSD'
+    :param rate_limiter: Rate limiter instance (if needed)
+    :param date: Date string in 'YYYY-MM-DD' format
+    :param interval: Kline interval, e.g., '1m'
+    :param data_type: 'um' for USD-M Futures, 'cm' for COIN-M Futures
+    :return: KlineBatch with the day's klines or None if there is nothing to insert
+    """
+    try:
+        batch = download_and_extract_zip_streaming(symbol, interval, date, data_type=data_type, rate_limiter=rate_limiter)
+        if batch is None:
+            logger.debug(f"No data for {symbol} on {date}. Skipping.")
+        return batch
+    except Exception as e:
+        logger.error(f"Unexpected failure for {symbol} on {date} ({interval}): {e}")
+        return None
+
+def fetch_monthly_candlesticks(symbol, rate_limiter, month, interval='1m', data_type='um'):
+    """
+    Fetch a full month of candlesticks from the monthly archive.
+
+    :param symbol: Trading symbol, e.g., 'ADABUSD'
+    :param rate_limiter: Rate limiter instance (if needed)
+    :param month: Month string in 'YYYY-MM' format
+    :param interval: Kline interval, e.g., '1m'
+    :param data_type: 'um' for USD-M Futures, 'cm' for COIN-M Futures
+    :return: KlineBatch with the month's klines, or None to fall back to daily archives
+    """
+    try:
+        return download_monthly_zip_streaming(symbol, interval, month, data_type=data_type, rate_limiter=rate_limiter)
+    except Exception as e:
+        logger.error(f"Unexpected failure for {symbol} in {month} ({interval}): {e}")
+        return None
 
 def fetch_and_insert_all_historical_data(rate_limiter, symbols=None, intervals=None, start_date='2019-12-31', end_date=None, data_type='um'):
     """
@@ -251,15 +916,21 @@ def fetch_and_insert_all_historical_data(rate_limiter, symbols=None, intervals=N
     end_date_display = end_date or 'today'
     logger.info(f"Starting historical data fetch for {len(symbols)} symbols, {len(intervals)} intervals from {start_date} to {end_date_display}.")
 
-    for idx, symbol in enumerate(symbols, 1):
+    # One progress bar for the whole fetch; symbol threads advance it as days are processed
+    progress = tqdm(total=len(symbols) * len(intervals) * len(dates), desc="Fetching historical data", unit="day")
+
+    def fetch_symbol(idx, symbol):
         logger.info(f"Fetching historical data for {symbol} ({idx}/{len(symbols)})...")
         for interval in intervals:
             try:
-                logger.info(f"  Fetching {interval} data for {symbol}...")
-                fetch_historical_candlesticks(symbol, rate_limiter, dates, interval=interval, data_type=data_type)
+                logger.debug(f"  Fetching {interval} data for {symbol}...")
+                fetch_historical_candlesticks(symbol, rate_limiter, dates, interval=interval, data_type=data_type, progress=progress)
             except Exception as e:
                 logger.error(f"Failed to fetch {interval} historical data for {symbol}: {e}")
-        # Optional: Sleep between symbols to distribute rate limit usage
-        time.sleep(0.1)
+
+    # Symbols are fetched concurrently; the shared rate limiter paces the requests across workers
+    with ThreadPoolExecutor(max_workers=SYMBOL_FETCH_WORKERS, thread_name_prefix='symbol') as executor:
+        list(executor.map(fetch_symbol, range(1, len(symbols) + 1), symbols))
+    progress.close()
 
     logger.info("Completed historical data fetch for all symbols and intervals.")
@@ -1,4 +1,5 @@
 import os
+import tempfile
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -16,6 +17,59 @@ DB_CONFIG = {
     'password': os.getenv('DB_PASSWORD', 'mysecretpassword'),
 }
 
+# Database connection pool size
+DB_POOL_MIN_CONN = int(os.getenv('DB_POOL_MIN_CONN', '2'))
+DB_POOL_MAX_CONN = int(os.getenv('DB_POOL_MAX_CONN', '16'))
+
+# synchronous_commit used by bulk kline inserts. Set it to 'off' to let a batch commit without waiting
+# for its WAL flush; a crash can then lose the last few batches, whose days are fetched again on the next run.
+DB_SYNCHRONOUS_COMMIT = os.getenv('DB_SYNCHRONOUS_COMMIT', 'on')
+
+# Maximum number of fetch operations running concurrently; further requests are queued
+FETCH_MAX_WORKERS = int(os.getenv('FETCH_MAX_WORKERS', '4'))
+
+# Seconds a completed or failed fetch stays queryable, and how many finished fetches are kept at most
+FINISHED_FETCH_TTL = int(os.getenv('FINISHED_FETCH_TTL', '3600'))
+MAX_FINISHED_FETCHES = max(1, int(os.getenv('MAX_FINISHED_FETCHES', '1000')))
+
+# Event streams (SSE and WebSocket) served at once; each holds a server thread for the life of a fetch,
+# so keep this well below GUNICORN_THREADS. Further streams are refused with 503
+MAX_EVENT_STREAMS = int(os.getenv('MAX_EVENT_STREAMS', '32'))
+
+# Number of symbols downloaded concurrently within a single fetch
+SYMBOL_FETCH_WORKERS = int(os.getenv('SYMBOL_FETCH_WORKERS', '4'))
+
+# Number of daily archives downloaded concurrently for each symbol
+DAY_FETCH_WORKERS = int(os.getenv('DAY_FETCH_WORKERS', '4'))
+
+# Keep-alive connections kept open to data.binance.vision; defaults to one per concurrent download thread
+HTTP_POOL_SIZE = int(os.getenv('HTTP_POOL_SIZE', str(FETCH_MAX_WORKERS * SYMBOL_FETCH_WORKERS * DAY_FETCH_WORKERS)))
+
+# Klines buffered per symbol and interval before they are written in one transaction; a partial
+# buffer is also written once its oldest archive has waited INSERT_BATCH_MS milliseconds
+INSERT_BATCH_ROWS = int(os.getenv('INSERT_BATCH_ROWS', '50000'))
+INSERT_BATCH_MS = int(os.getenv('INSERT_BATCH_MS', '500'))
+
+# Directory where downloaded kline archives are kept for reuse across runs; caching is off when unset
+ARCHIVE_CACHE_DIR = os.getenv('ARCHIVE_CACHE_DIR')
+
+# Size limit of the archive cache in megabytes; the least recently used archives are evicted
+# beyond it. 0 means no limit.
+ARCHIVE_CACHE_MAX_MB = int(os.getenv('ARCHIVE_CACHE_MAX_MB', '0'))
+
+# Seconds an archive that returned 404 is skipped before it is requested again; recorded in the archive cache
+MISSING_ARCHIVE_TTL = int(os.getenv('MISSING_ARCHIVE_TTL', str(7 * 24 * 3600)))
+
+# File where the futures exchange info is cached between processes, and how many seconds it stays
+# valid there; an empty path disables the file cache
+EXCHANGE_INFO_CACHE_PATH = os.getenv(
+    'EXCHANGE_INFO_CACHE_PATH', os.path.join(tempfile.gettempdir(), 'binance_futures_exchange_info.json')
+)
+EXCHANGE_INFO_CACHE_TTL = int(os.getenv('EXCHANGE_INFO_CACHE_TTL', '3600'))
+
+# Seconds to cache the perpetual futures symbol list fetched from Binance
+SYMBOLS_CACHE_TTL = int(os.getenv('SYMBOLS_CACHE_TTL', '300'))
+
 # Logging configuration
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'DEBUG')
 LOG_FORMAT = '%(asctime)s - %(levelname)s - %(name)s - %(message)s'
\ No newline at end of file
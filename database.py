@@ -2,28 +2,189 @@ import psycopg2
 import logging
 import traceback
 import socket
-from psycopg2.extras import execute_values
-from config import DB_CONFIG
+import struct
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from itertools import groupby
+from operator import itemgetter
+from threading import BoundedSemaphore, Lock
+from typing import NamedTuple
+from weakref import WeakKeyDictionary
+from psycopg2.pool import ThreadedConnectionPool
+import numpy as np
+from config import DB_CONFIG, DB_POOL_MIN_CONN, DB_POOL_MAX_CONN, DB_SYNCHRONOUS_COMMIT
 
 logger = logging.getLogger(__name__)
 
-# Global connection and cursor variables
-conn = None
-cursor = None
+# Map timeframes to table names
+TABLE_MAPPING = {
+    '1m': 'futures_data_historical_1m',
+    '5m': 'futures_data_historical_5m',
+    '1h': 'futures_data_historical_1h',
+    '1d': 'futures_data_historical_1d'
+}
+
+# Columns of the candlestick tables
+INSERT_COLUMNS = "exchange, symbol, timestamp, open, high, low, close, volume"
+
+# Per-session staging table for bulk COPY. It holds only the per-row columns: exchange and
+# symbol are bound once in the merge, and open times are staged as integer milliseconds
+# and converted to timestamps in SQL, so no datetime objects are built per row.
+STAGE_TABLE = "stage_klines"
+CREATE_STAGE_QUERY = f"""
+CREATE TEMP TABLE IF NOT EXISTS {STAGE_TABLE} (
+    open_time_ms BIGINT NOT NULL,
+    open DOUBLE PRECISION NOT NULL,
+    high DOUBLE PRECISION NOT NULL,
+    low DOUBLE PRECISION NOT NULL,
+    close DOUBLE PRECISION NOT NULL,
+    volume DOUBLE PRECISION NOT NULL
+) ON COMMIT DELETE ROWS;
+"""
+COPY_QUERY = f"COPY {STAGE_TABLE} FROM STDIN WITH (FORMAT binary)"
+# Binary COPY framing: signature, flags and header extension length, then the end-of-data marker
+PGCOPY_HEADER = b'PGCOPY\n\xff\r\n\x00' + struct.pack('>ii', 0, 0)
+PGCOPY_TRAILER = struct.pack('>h', -1)
+PRICE_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+# Binary COPY row layout: field count, then a length-prefixed big-endian value per column
+COPY_ROW_TYPE = np.dtype([
+    ('fields', '>i2'),
+    ('open_time_len', '>i4'), ('open_time_ms', '>i8'),
+    *((name, fmt) for column in PRICE_COLUMNS for name, fmt in ((f'{column}_len', '>i4'), (column, '>f8'))),
+])
+
+# Merge from the staging table into each candlestick table, prepared once per connection so every
+# batch after the first skips parsing and planning. Rows already stored are skipped.
+MERGE_STATEMENTS = {timeframe: f"merge_klines_{timeframe}" for timeframe in TABLE_MAPPING}
+PREPARE_MERGE_QUERIES = {
+    timeframe: f"""
+    PREPARE {MERGE_STATEMENTS[timeframe]} (text, text) AS
+    INSERT INTO {table_name} ({INSERT_COLUMNS})
+    SELECT $1, $2, to_timestamp(open_time_ms / 1000.0), open, high, low, close, volume
+    FROM {STAGE_TABLE}
+    ON CONFLICT (exchange, symbol, timestamp) DO NOTHING;
+    """
+    for timeframe, table_name in TABLE_MAPPING.items()
+}
+
+# Rows encoded per COPY chunk and bytes handed to COPY per read; only one chunk is held in memory at a time
+COPY_CHUNK_ROWS = 5000
+COPY_READ_SIZE = 64 * 1024
+
+class KlineBatch(NamedTuple):
+    """
+    Candlesticks for one symbol stored column-wise, one NumPy array per field.
+    """
+    open_time: np.ndarray  # int64 milliseconds
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+# Lazily created connection pool shared across threads
+pool = None
+_pool_lock = Lock()
+
+# Timeframes whose merge statement is prepared on each pooled connection
+_prepared_merges = WeakKeyDictionary()
+_prepared_merges_lock = Lock()
+
+# ThreadedConnectionPool raises instead of blocking when exhausted, so callers wait for a free slot here
+_pool_slots = BoundedSemaphore(DB_POOL_MAX_CONN)
+
+class PoolBusyError(Exception):
+    """Raised when no pooled connection frees up within the requested timeout."""
+
+class CopyStream:
+    """
+    Read-only file object that feeds pre-encoded chunks to COPY FROM STDIN.
+
+    Chunks are pulled from the source iterator only as COPY reads them, so memory
+    stays bounded no matter how many rows are streamed.
+    """
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._buffer = b''
+        self._position = 0
+        self.row_count = 0
+
+    def _fill(self):
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            return False
+        data, rows = chunk
+        self._buffer = self._buffer[self._position:] + data
+        self._position = 0
+        self.row_count += rows
+        return True
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            while self._fill():
+                pass
+            size = len(self._buffer) - self._position
+        while len(self._buffer) - self._position < size and self._fill():
+            pass
+        data = self._buffer[self._position:self._position + size]
+        self._position += len(data)
+        return data
+
+    def readline(self, size=-1):
+        return self.read(size)
+
+def kline_binary_chunks(batch):
+    """
+    Encode a KlineBatch in PostgreSQL's binary COPY format, COPY_CHUNK_ROWS rows at a time.
+
+    Every staged field has a fixed width, so each chunk is a NumPy structured array filled
+    column by column; no value goes through text.
+
+    :param batch: KlineBatch to encode
+    :return: Generator of (copy_bytes, row_count) pairs
+    """
+    rows_total = len(batch.open_time)
+
+    yield PGCOPY_HEADER, 0
+    for start in range(0, rows_total, COPY_CHUNK_ROWS):
+        stop = min(start + COPY_CHUNK_ROWS, rows_total)
+        rows = np.empty(stop - start, dtype=COPY_ROW_TYPE)
+        rows['fields'] = 1 + len(PRICE_COLUMNS)
+        rows['open_time_len'] = 8
+        rows['open_time_ms'] = batch.open_time[start:stop]
+        for column in PRICE_COLUMNS:
+            rows[f'{column}_len'] = 8
+            rows[column] = getattr(batch, column)[start:stop]
+        yield rows.tobytes(), stop - start
+    yield PGCOPY_TRAILER, 0
+
+def unique_klines(batch):
+    """
+    Drop repeated open times from a KlineBatch, keeping the first row for each, in open time order.
+
+    Batches from archives are normally strictly increasing already and are returned as is.
+
+    :param batch: KlineBatch to deduplicate
+    :return: KlineBatch with one row per open time
+    """
+    if np.all(np.diff(batch.open_time) > 0):
+        return batch
+    _, first_rows = np.unique(batch.open_time, return_index=True)
+    return KlineBatch(*(column[first_rows] for column in batch))
 
 def connect_to_database(max_retries=3, retry_delay=5):
     """
-    Establish a connection to TimescaleDB with retry logic and enhanced error reporting.
+    Create the connection pool to TimescaleDB with retry logic and enhanced error reporting.
     
     Args:
         max_retries: Maximum number of connection attempts
         retry_delay: Seconds to wait between retries
     
     Returns:
-        tuple: (connection, cursor) if successful, raises exception otherwise
+        ThreadedConnectionPool: The shared pool if successful, raises exception otherwise
     """
-    global conn, cursor
-    
     import time
     
     for attempt in range(1, max_retries + 1):
@@ -40,15 +201,16 @@ def connect_to_database(max_retries=3, retry_delay=5):
                 logger.error(f"DNS resolution failed for {DB_CONFIG['host']}: {e}")
             
             # Attempt connection with timeout
-            conn = psycopg2.connect(**DB_CONFIG, connect_timeout=10)
-            cursor = conn.cursor()
+            db_pool = get_connection_pool()
             
             # Test the connection with a simple query
-            cursor.execute("SELECT version();")
-            version = cursor.fetchone()[0]
+            with pooled_connection() as conn, conn.cursor() as cursor:
+                cursor.execute("SELECT version();")
+                version = cursor.fetchone()[0]
+                conn.rollback()
             logger.info(f"Connected to TimescaleDB successfully. Server version: {version}")
             
-            return conn, cursor
+            return db_pool
             
         except psycopg2.OperationalError as e:
             error_msg = str(e).strip()
@@ -84,91 +246,160 @@ def connect_to_database(max_retries=3, retry_delay=5):
             logger.error(f"Traceback: {traceback.format_exc()}")
             raise
 
+def get_connection_pool():
+    """
+    Return the shared connection pool, creating it on first use.
+
+    Returns:
+        ThreadedConnectionPool: Pool of connections to TimescaleDB
+    """
+    global pool
+
+    with _pool_lock:
+        if pool is None or pool.closed:
+            logger.info(f"Creating database connection pool ({DB_POOL_MIN_CONN}-{DB_POOL_MAX_CONN} connections)")
+            pool = ThreadedConnectionPool(DB_POOL_MIN_CONN, DB_POOL_MAX_CONN, **DB_CONFIG, connect_timeout=10)
+    return pool
+
+@contextmanager
+def pooled_connection(timeout=None):
+    """
+    Borrow a connection from the shared pool for the duration of a with block.
+
+    Connections that raised a database error or were closed are discarded
+    instead of being returned to the pool.
+
+    :param timeout: Seconds to wait for a free connection, or None to wait indefinitely
+    :return: psycopg2 connection
+    :raises PoolBusyError: If no connection frees up within timeout
+    """
+    if not _pool_slots.acquire(timeout=timeout):
+        raise PoolBusyError(f"No database connection available within {timeout} seconds")
+    try:
+        db_pool = get_connection_pool()
+        conn = db_pool.getconn()
+        broken = False
+        try:
+            yield conn
+        except psycopg2.Error:
+            broken = True
+            raise
+        finally:
+            db_pool.putconn(conn, close=broken or bool(conn.closed))
+    finally:
+        _pool_slots.release()
+
+def ping_database(timeout=None):
+    """
+    Check database connectivity by running SELECT 1 on a pooled connection.
+
+    Args:
+        timeout: Seconds to wait for a free pooled connection, or None to wait indefinitely
+
+    Returns:
+        bool: True if the query succeeded, raises exception otherwise (PoolBusyError if the pool stayed full)
+    """
+    with pooled_connection(timeout) as conn, conn.cursor() as cursor:
+        cursor.execute("SELECT 1;")
+        cursor.fetchone()
+        conn.rollback()
+    return True
+
 # Try to establish the initial connection
 try:
-    conn, cursor = connect_to_database()
+    connect_to_database()
 except Exception as e:
     logger.critical(f"Failed to establish initial database connection: {e}")
     # Don't raise here to allow the application to start even with DB issues
     # The application can try to reconnect later
 
+def to_epoch_ms(open_time):
+    """
+    Convert an open time to integer milliseconds since the epoch.
+
+    :param open_time: Integer milliseconds, or a datetime (naive datetimes are taken as UTC)
+    :return: Integer milliseconds
+    """
+    if isinstance(open_time, datetime):
+        if open_time.tzinfo is None:
+            open_time = open_time.replace(tzinfo=timezone.utc)
+        return int(open_time.timestamp() * 1000)
+    return int(open_time)
+
 def insert_futures_data(data, timeframe):
     """
     Insert a list of candlestick data into the appropriate TimescaleDB table based on timeframe.
-    Includes connection recovery logic.
+    Rows are grouped by exchange and symbol and loaded as column batches.
 
-    :param data: List of tuples containing candlestick data
+    :param data: Iterable of (exchange, symbol, open_time, open, high, low, close, volume) tuples;
+        open_time is either integer milliseconds or a datetime (naive datetimes are taken as UTC)
     :param timeframe: Timeframe string (1m, 5m, 1h, 1d)
     """
-    global conn, cursor
-
-    # Check if connection is still alive, reconnect if needed
-    try:
-        if conn is None or cursor is None or conn.closed:
-            logger.warning("Database connection lost. Attempting to reconnect...")
-            conn, cursor = connect_to_database()
-    except Exception as e:
-        logger.error(f"Failed to reconnect to database: {e}")
-        raise
-
-    # Map timeframes to table names
-    table_mapping = {
-        '1m': 'futures_data_historical_1m',
-        '5m': 'futures_data_historical_5m',
-        '1h': 'futures_data_historical_1h',
-        '1d': 'futures_data_historical_1d'
-    }
+    for (exchange, symbol), rows in groupby(sorted(data, key=itemgetter(0, 1)), key=itemgetter(0, 1)):
+        columns = list(zip(*rows))
+        batch = KlineBatch(
+            np.array([to_epoch_ms(open_time) for open_time in columns[2]], dtype='int64'),
+            *(np.array(values, dtype='float64') for values in columns[3:8]),
+        )
+        insert_kline_batch(batch, symbol, timeframe, exchange)
 
-    if timeframe not in table_mapping:
-        raise ValueError(f"Unsupported timeframe: {timeframe}. Supported: {list(table_mapping.keys())}")
+def insert_kline_batch(batch, symbol, timeframe, exchange='binance'):
+    """
+    Insert a column batch of candlesticks for one symbol into the appropriate TimescaleDB table.
+    Each call borrows its own pooled connection, so concurrent workers insert in parallel.
 
-    table_name = table_mapping[timeframe]
-    insert_query = f"""
-    INSERT INTO {table_name} (exchange, symbol, timestamp, open, high, low, close, volume)
-    VALUES %s
-    ON CONFLICT (exchange, symbol, timestamp) DO NOTHING
-    RETURNING exchange;
+    :param batch: KlineBatch with the symbol's candlesticks
+    :param symbol: Trading symbol, e.g., 'ADABUSD'
+    :param timeframe: Timeframe string (1m, 5m, 1h, 1d)
+    :param exchange: Exchange name (default: 'binance')
     """
+    if timeframe not in TABLE_MAPPING:
+        raise ValueError(f"Unsupported timeframe: {timeframe}. Supported: {list(TABLE_MAPPING.keys())}")
 
-    try:
-        if not data:
-            logger.warning("Attempted to insert empty data set")
-            return
-
-        logger.debug(f"Inserting {len(data)} records into {table_name} for symbol {data[0][1]}.")
-        execute_values(cursor, insert_query, data, page_size=1000)
-        inserted_rows = cursor.fetchall()
-        rows_inserted = len(inserted_rows)
-        conn.commit()
-        if rows_inserted:
-            logger.debug(f"Inserted {rows_inserted} records into {table_name}.")
-        else:
-            logger.debug("No new records were inserted.")
-    except psycopg2.Error as e:
-        logger.error(f"Database error inserting data: {e.pgerror if hasattr(e, 'pgerror') else str(e)}")
-        logger.error(f"Error code: {e.pgcode if hasattr(e, 'pgcode') else 'N/A'}")
-        conn.rollback()
+    table_name = TABLE_MAPPING[timeframe]
 
-        # Try to reconnect if it's a connection issue
-        if isinstance(e, psycopg2.OperationalError) or "connection" in str(e).lower():
-            logger.warning("Connection may be lost. Attempting to reconnect...")
-            try:
-                conn, cursor = connect_to_database()
-                logger.info("Reconnected to database successfully.")
-            except Exception as reconnect_error:
-                logger.error(f"Failed to reconnect: {reconnect_error}")
-        raise
-    except Exception as e:
-        logger.error(f"Unexpected error inserting data into {table_name}: {e}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
+    # Duplicates within the batch are dropped here, so they are neither sent nor checked against the index
+    stream = CopyStream(kline_binary_chunks(unique_klines(batch)))
+
+    with pooled_connection() as conn:
+        try:
+            logger.debug(f"Streaming {symbol} records into {table_name}.")
+            with conn.cursor() as cursor:
+                cursor.execute("SET LOCAL synchronous_commit = %s", (DB_SYNCHRONOUS_COMMIT,))
+                cursor.execute(CREATE_STAGE_QUERY)
+                cursor.copy_expert(COPY_QUERY, stream, size=COPY_READ_SIZE)
+                if not stream.row_count:
+                    logger.warning("Attempted to insert empty data set")
+                    conn.rollback()
+                    return
+                # Rows are bulk-loaded into the staging table with COPY, then merged by the prepared statement
+                with _prepared_merges_lock:
+                    prepared = _prepared_merges.setdefault(conn, set())
+                if timeframe not in prepared:
+                    cursor.execute(PREPARE_MERGE_QUERIES[timeframe])
+                    prepared.add(timeframe)
+                cursor.execute(f"EXECUTE {MERGE_STATEMENTS[timeframe]} (%s, %s)", (exchange, symbol))
+                rows_inserted = cursor.rowcount
+            conn.commit()
+            if rows_inserted:
+                logger.debug(f"Inserted {rows_inserted} of {stream.row_count} records into {table_name}.")
+            else:
+                logger.debug("No new records were inserted.")
+        except psycopg2.Error as e:
+            logger.error(f"Database error inserting data: {e.pgerror if hasattr(e, 'pgerror') else str(e)}")
+            logger.error(f"Error code: {e.pgcode if hasattr(e, 'pgcode') else 'N/A'}")
+            if not conn.closed:
+                conn.rollback()
+            # The pool discards this connection; the next call gets a fresh one
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error inserting data into {table_name}: {e}")
+            logger.error(f"Traceback: {traceback.format_exc()}")
 
-        # Include sample of problematic data for debugging
-        if data:
-            sample = data[0] if len(data) == 1 else f"{data[0]} ... (and {len(data)-1} more)"
-            logger.debug(f"Sample data that caused the error: {sample}")
+            logger.debug(f"Failed after streaming {stream.row_count} records.")
 
-        conn.rollback()
-        raise
+            conn.rollback()
+            raise
 
 # Backward compatibility function
 def insert_futures_data_1m(data):
@@ -187,29 +418,10 @@ def check_data_exists(symbol, date, timeframe, exchange='binance'):
     :param exchange: Exchange name (default: 'binance')
     :return: True if data exists, False otherwise
     """
-    global conn, cursor
+    if timeframe not in TABLE_MAPPING:
+        raise ValueError(f"Unsupported timeframe: {timeframe}. Supported: {list(TABLE_MAPPING.keys())}")
 
-    # Check if connection is still alive, reconnect if needed
-    try:
-        if conn is None or cursor is None or conn.closed:
-            logger.warning("Database connection lost. Attempting to reconnect...")
-            conn, cursor = connect_to_database()
-    except Exception as e:
-        logger.error(f"Failed to reconnect to database: {e}")
-        raise
-
-    # Map timeframes to table names
-    table_mapping = {
-        '1m': 'futures_data_historical_1m',
-        '5m': 'futures_data_historical_5m',
-        '1h': 'futures_data_historical_1h',
-        '1d': 'futures_data_historical_1d'
-    }
-
-    if timeframe not in table_mapping:
-        raise ValueError(f"Unsupported timeframe: {timeframe}. Supported: {list(table_mapping.keys())}")
-
-    table_name = table_mapping[timeframe]
+    table_name = TABLE_MAPPING[timeframe]
 
     # Query to check if any data exists for the given symbol and date
     check_query = f"""
@@ -219,11 +431,42 @@ def check_data_exists(symbol, date, timeframe, exchange='binance'):
     """
 
     try:
-        cursor.execute(check_query, (exchange, symbol, date))
-        count = cursor.fetchone()[0]
+        with pooled_connection() as conn, conn.cursor() as cursor:
+            cursor.execute(check_query, (exchange, symbol, date))
+            count = cursor.fetchone()[0]
+            conn.rollback()
         exists = count > 0
         logger.debug(f"Data exists check for {symbol} on {date} ({timeframe}): {exists} ({count} records)")
         return exists
     except Exception as e:
         logger.error(f"Error checking if data exists for {symbol} on {date} ({timeframe}): {e}")
         return False
+
+def get_days_with_data(symbol, start_date, end_date, timeframe, exchange='binance'):
+    """
+    List the days between two dates (inclusive) that already have data in the database, in one query.
+
+    :param symbol: Trading symbol, e.g., 'ADABUSD'
+    :param start_date: First date string in 'YYYY-MM-DD' format
+    :param end_date: Last date string in 'YYYY-MM-DD' format
+    :param timeframe: Timeframe string (1m, 5m, 1h, 1d)
+    :param exchange: Exchange name (default: 'binance')
+    :return: Set of date strings in 'YYYY-MM-DD' format with at least one record
+    """
+    if timeframe not in TABLE_MAPPING:
+        raise ValueError(f"Unsupported timeframe: {timeframe}. Supported: {list(TABLE_MAPPING.keys())}")
+
+    table_name = TABLE_MAPPING[timeframe]
+
+    days_query = f"""
+    SELECT DISTINCT DATE(timestamp) FROM {table_name}
+    WHERE exchange = %s AND symbol = %s
+    AND timestamp >= %s::date AND timestamp < %s::date + 1
+    """
+
+    with pooled_connection() as conn, conn.cursor() as cursor:
+        cursor.execute(days_query, (exchange, symbol, start_date, end_date))
+        days = {day.isoformat() for day, in cursor.fetchall()}
+        conn.rollback()
+    logger.debug(f"{symbol} has data for {len(days)} days between {start_date} and {end_date} ({timeframe})")
+    return days
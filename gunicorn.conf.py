@@ -0,0 +1,37 @@
+"""
+Gunicorn configuration for the Historical Data Fetcher API
+
+Usage:
+    gunicorn -c gunicorn.conf.py api:app
+"""
+
+import os
+
+from logging_setup import setup_logging
+
+# Bind to the same port as the development server
+bind = f"0.0.0.0:{os.environ.get('FLASK_PORT', 5001)}"
+
+# Fetch state (active fetches, the fetch executor) lives in the worker process, so a single
+# worker keeps status lookups consistent. Concurrency comes from threads: blocking calls to
+# Binance or the database only hold one thread, but every SSE or WebSocket stream holds one for
+# the whole fetch. The default leaves plenty of threads for regular requests even with
+# MAX_EVENT_STREAMS (default: 32) streams open.
+workers = int(os.environ.get('GUNICORN_WORKERS', 1))
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 64))
+
+# Fetches run on background threads, so regular requests are short; the generous
+# timeout covers symbol validation against Binance during slow API responses
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 300))
+graceful_timeout = 30
+keepalive = 5
+
+# Log to stdout/stderr like the rest of the service
+accesslog = '-'
+errorlog = '-'
+loglevel = os.environ.get('LOG_LEVEL', 'info').lower()
+
+def post_worker_init(worker):
+    """Configure application logging once the worker has loaded the app."""
+    setup_logging()
@@ -0,0 +1,22 @@
+import logging
+import sys
+from config import LOG_LEVEL, LOG_FORMAT
+
+def setup_logging():
+    """
+    Configure the root logger for the service.
+
+    Entry points call this once at startup; library modules only create their own loggers.
+    Calling it again is a no-op, so handlers are never stacked.
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return
+
+    logging.basicConfig(
+        level=LOG_LEVEL,
+        format=LOG_FORMAT,
+        handlers=[
+            logging.StreamHandler(sys.stdout)
+        ]
+    )
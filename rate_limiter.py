@@ -13,13 +13,18 @@ class BinanceRateLimiter:
         self.locks = {}
         self.counters = {}
         self.reset_times = {}
+        # (limit, interval seconds) per type, resolved once so acquire() does no lookups
+        self.windows = {}
         self.lock = Lock()
         
         for limit in self.rate_limits:
             key = limit['rateLimitType']
+            if key in self.windows:
+                continue  # rate_limits_by_type() uses the first entry of each type
             self.locks[key] = Lock()
             self.counters[key] = 0
             interval = limit['intervalNum'] * self.get_interval_seconds(limit['interval'])
+            self.windows[key] = (limit['limit'], interval)
             self.reset_times[key] = time.time() + interval
 
     def get_interval_seconds(self, interval):
@@ -39,32 +44,30 @@ class BinanceRateLimiter:
     def acquire(self, rate_limit_type):
         """
         Acquire permission to make a request under the specified rate limit type.
+        The lock only guards the counter update; callers that must wait sleep without holding it.
         """
-        with self.locks[rate_limit_type]:
-            current_time = time.time()
-            if current_time >= self.reset_times[rate_limit_type]:
-                # Reset the counter and reset time
-                self.counters[rate_limit_type] = 0
-                interval = self.rate_limits_by_type(rate_limit_type)['intervalNum'] * \
-                           self.get_interval_seconds(self.rate_limits_by_type(rate_limit_type)['interval'])
-                self.reset_times[rate_limit_type] = current_time + interval
-                logger.debug(f"Resetting rate limit for {rate_limit_type}. New reset time: {self.reset_times[rate_limit_type]}")
+        if rate_limit_type not in self.windows:
+            self.rate_limits_by_type(rate_limit_type)  # Raises ValueError for unknown types
+        limit, interval = self.windows[rate_limit_type]
+        lock = self.locks[rate_limit_type]
+
+        while True:
+            with lock:
+                current_time = time.time()
+                if current_time >= self.reset_times[rate_limit_type]:
+                    # Reset the counter and reset time
+                    self.counters[rate_limit_type] = 0
+                    self.reset_times[rate_limit_type] = current_time + interval
+
+                if self.counters[rate_limit_type] < limit:
+                    self.counters[rate_limit_type] += 1
+                    return
 
-            if self.counters[rate_limit_type] < self.rate_limits_by_type(rate_limit_type)['limit']:
-                self.counters[rate_limit_type] += 1
-                logger.debug(f"Acquired {rate_limit_type} request. Count: {self.counters[rate_limit_type]}")
-                return
-            else:
                 # Need to wait until the reset time
                 sleep_time = self.reset_times[rate_limit_type] - current_time
-                logger.warning(f"Rate limit reached for {rate_limit_type}. Sleeping for {sleep_time:.2f} seconds.")
-                time.sleep(sleep_time)
-                # Reset after sleeping
-                self.counters[rate_limit_type] = 1
-                self.reset_times[rate_limit_type] = time.time() + \
-                    self.rate_limits_by_type(rate_limit_type)['intervalNum'] * \
-                    self.get_interval_seconds(self.rate_limits_by_type(rate_limit_type)['interval'])
-                logger.debug(f"Resumed after sleep. New count for {rate_limit_type}: {self.counters[rate_limit_type]}")
+
+            logger.warning(f"Rate limit reached for {rate_limit_type}. Sleeping for {sleep_time:.2f} seconds.")
+            time.sleep(sleep_time)
 
     def rate_limits_by_type(self, rate_limit_type):
         """